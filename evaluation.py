@@ -1,558 +1,898 @@
-import neighborhoodConnectivity as nC
-import networkx as nx
-import graphs
-from sklearn.metrics.cluster import normalized_mutual_info_score
-import copy
-import math
-import os
-import plotting
-from sklearn.metrics import r2_score
-path = os.path.abspath(os.path.dirname(__file__))
-
-
-def modularity_deviation(number_of_runs=50, iterations=50, save_plot_to_csv=True):
-    """
-    Creates a plot that compares the results for real world data sets to their best known modularity values.
-
-    Parameters
-    ----------
-    number_of_runs : int
-        Determines how often each graph will be analysed.
-    iterations : int
-        The number of simulated annealing iterations.
-    save_plot_to_csv : bool
-        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
-
-    Returns
-    -------
-    NOTHING
-    """
-    save_plot = True
-    type = "mod_dev"
-
-    # best known solutions
-    karate_max = 0.41979  # number of comm = 4
-    dolphins_max = 0.52852  # number of comm = 5
-    miserables_max = 0.56001  # number of comm = 8
-    protein_max = 0.6491  # number of comm = 7 by mod-max, 10 is ground-truth
-    books_max = 0.52724  # number of comm = 4?
-    # jazz_max = 0.4452  # number of comm = 4
-    # elegans_max = 0.4342  # number of comm = 12
-
-    bestMod = [karate_max, dolphins_max, miserables_max, protein_max, books_max]
-    deviation = [[], [], [], [], []]
-
-    labels = ["karate", "dolphins", "miserables", "protein", "books"]
-
-    i = 0
-    for label in labels:
-        for j in range(number_of_runs):
-            print("Analyzing graph " + label + ", run number " + str(j) + ":\n")
-
-            G = nx.read_gml(os.path.join(path, 'graphs', label + '.gml'))
-            G = nx.relabel.convert_node_labels_to_integers(G)
-
-            node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations,
-                                                                        draw=False)
-            communities = nC.greedy_separation_node_classification(G, node_classification)
-            node_assignments = graphs.assign_nodes_to_coms(G, communities)
-            modularity = graphs.calculate_modularity(G, node_assignments)
-
-            print("Best known Modularity for " + label + " is: " + str(bestMod[i]))
-            print("Calculated Modularity is: " + str(modularity))
-
-            deviation[i].append(modularity / bestMod[i])
-
-            print("Deviation: \n" + str(deviation[i]))
-
-        i += 1
-
-    plotting.create_box_plot(deviation, labels, save_plot, type, y_axis="Deviation in %")
-
-    # save_plot_to_csv check
-    if save_plot_to_csv:
-        _ = plotting.create_plot_csv_file(type, deviation, labels)
-
-
-def nmi_deviation(amount_of_graphs=50, iterations=50, save_seeds=True, save_plot_to_csv=True):
-    """
-    Creates a plot that compares the results for three different complexity of lfr graphs with their ground truth.
-
-    Parameters
-    ----------
-    amount_of_graphs : int
-        Amount of graphs analyzed for each tier.
-    iterations : int
-        The number of simulated annealing iterations.
-    save_seeds : bool
-        Determines whether the seeds and the results should get saved into an extra file.
-    save_plot_to_csv : bool
-        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
-
-    Returns
-    -------
-    NOTHING
-    """
-    save_plot = True
-    labels = ["easy", "medium", "hard"]
-    deviation = [[], [], []]
-    type = "nmi_dev"
-
-    # save_seeds check
-    seedfile = None
-    if save_seeds:
-        seedfile = plotting.create_seed_file(type)
-
-    i = 0
-    for label in labels:
-
-        if not (seedfile is None):
-            plotting.write_seed_file(seedfile, label, ["normalized mutual information score"])
-
-        for j in range(amount_of_graphs):
-
-            print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
-
-            G = graphs.create_lfr_graph(label, seedfile)
-            com_index_dict = graphs.assign_com_index_ground_truth(G)
-            com_index_list = list(com_index_dict.values())
-
-            node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations,
-                                                                        draw=False)
-            communities = nC.greedy_separation_node_classification(G, node_classification)
-            node_assignments = graphs.assign_nodes_to_coms(G, communities)
-            node_assignments_list = list(node_assignments.values())
-
-            # print("com_index: " + str(com_index_dict))
-            print("ass: " + str(node_assignments))
-
-            nmi_score = normalized_mutual_info_score(com_index_list, node_assignments_list)
-            print("Normalized mutual info score for " + str(label) + " graph is: " + str(nmi_score) + "\n")
-
-            deviation[i].append(nmi_score)
-
-            print("NMI scores: \n" + str(deviation[i]) + "\n")
-
-            # save results to seeds file
-            if not (seedfile is None):
-                with open(seedfile, "a") as f:
-                    f.write(f"{str(deviation[i][j]):20}\n")
-
-        i += 1
-
-    plotting.create_box_plot(deviation, labels, save_plot, type, y_axis="NMI score")
-
-    # save_plot_to_csv check
-    if save_plot_to_csv:
-        _ = plotting.create_plot_csv_file(type, deviation, labels)
-
-
-def com_deviation(amount_of_graphs=50, iterations=50, save_seeds=True, save_plot_to_csv=True):
-    """
-    Creates a plot that compares the number of communities found by the algorithm to the actual ground truth number of
-    communities.
-
-    Parameters
-    ----------
-    amount_of_graphs : int
-        Amount of graphs analyzed for each tier.
-    iterations : int
-        The number of simulated annealing iterations.
-    save_seeds : bool
-        Determines whether the seeds and the results should get saved into an extra file.
-    save_plot_to_csv : bool
-        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
-
-    Returns
-    -------
-    NOTHING
-    """
-    save_plot = True
-    deviation = [[], [], []]
-    labels = ["easy", "medium", "hard"]
-    type = "com_dev"
-
-    # save_seeds check
-    seedfile = None
-    if save_seeds:
-        seedfile = plotting.create_seed_file(type)
-
-    i = 0
-    for label in labels:
-
-        if not (seedfile is None):
-            plotting.write_seed_file(seedfile, label, ["coms found", "coms ground truth", "deviation"])
-
-        for j in range(amount_of_graphs):
-
-            print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
-
-            G = graphs.create_lfr_graph(label, seedfile)
-
-            node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations,
-                                                                        draw=False)
-            communities = nC.greedy_separation_node_classification(G, node_classification)
-            # node_assignments = graphs.assign_nodes_to_coms(G, communities)
-
-            coms_found = len(communities.keys())
-            coms_gt = graphs.count_lfr_coms(G)
-            deviation[i].append(coms_found / coms_gt)
-
-            print("Deviation: \n" + str(deviation[i]) + "\n")
-
-            # save results to seeds file
-            if not (seedfile is None):
-                with open(seedfile, "a") as f:
-                    f.write(f"{str(coms_found):20}{str(coms_gt):20}{str(deviation[i][j]):20}\n")
-
-        i += 1
-
-    plotting.create_box_plot(deviation, labels, save_plot, type, y_axis="Deviation")
-
-    # save_plot_to_csv check
-    if save_plot_to_csv:
-        _ = plotting.create_plot_csv_file(type, deviation, labels)
-
-
-def separation_node_set_deviation(amount_of_graphs=50, iterations=50, save_seeds=True, save_plot_to_csv=True):
-    """
-    Creates a plot that compares the number of separation nodes found by the algorithm to the minimum set of optimal
-    separation nodes.
-
-    Parameters
-    ----------
-    amount_of_graphs : int
-        Amount of graphs analyzed for each tier.
-    iterations : int
-        The number of simulated annealing iterations.
-    save_seeds : bool
-        Determines whether the seeds and the results should get saved into an extra file.
-    save_plot_to_csv : bool
-        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
-
-    Returns
-    -------
-    NOTHING
-    """
-    save_plot = True
-    deviation = [[], [], []]
-    labels = ["easy", "medium", "hard"]
-    type = "sep_nodes_dev"
-
-    # save_seeds check
-    seedfile = None
-    if save_seeds:
-        seedfile = plotting.create_seed_file(type)
-
-    i = 0
-    for label in labels:
-
-        if not (seedfile is None):
-            plotting.write_seed_file(seedfile, label, ["sep nodes found", "sep nodes gt", "deviation"])
-
-        for j in range(amount_of_graphs):
-
-            print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
-
-            G = graphs.create_lfr_graph(label, seedfile)
-
-            separation_nodes_amount_gt = len(set(graphs.find_separation_node_set(G)))
-            # num_sn = len(find_optimal_separation_node_set(G))
-
-            while separation_nodes_amount_gt == 0:
-                separation_nodes_amount_gt = len(set(graphs.find_separation_node_set(G)))
-                print("Trying to find separation node set.", end="\r")
-            else:
-                print("\nThe minimum amount of separation nodes for the graph " + label + " is " + str(
-                    separation_nodes_amount_gt))
-
-            node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations,
-                                                                        draw=False)
-            # communities = nC.greedy_separation_node_classification(G, node_classification)
-            # node_assignments = graphs.assign_nodes_to_coms(G, communities)
-
-            separation_nodes = [i for i in node_classification.keys() if node_classification[i] == 0]
-            separation_nodes_count = len(separation_nodes)
-
-            print("Amount of separation nodes found: " + str(separation_nodes_count))
-
-            deviation[i].append(separation_nodes_count / separation_nodes_amount_gt)
-
-            print("\nDeviation: \n" + str(deviation[i]) + "\n")
-
-            # save results to seeds file
-            if not (seedfile is None):
-                with open(seedfile, "a") as f:
-                    f.write(
-                        f"{str(separation_nodes_count):20}"
-                        f"{str(separation_nodes_amount_gt):20}{str(deviation[i][j]):20}\n")
-
-        i += 1
-
-    plotting.create_box_plot(deviation, labels, save_plot, type, y_axis="Deviation")
-
-    # save_plot_to_csv check
-    if save_plot_to_csv:
-        _ = plotting.create_plot_csv_file(type, deviation, labels)
-
-
-def prediction_deviation(amount_of_graphs=50, save_seeds=True, save_plot_to_csv=True):
-    """
-    Creates a plot that compares the prediction for nodes/edges to whether they are actually separating
-    (0 is random guessing and 1 would always be correct)
-
-    Parameters
-    ----------
-    amount_of_graphs : int
-        Amount of graphs analyzed for each tier.
-    save_seeds : bool
-        Determines whether the seeds and the results should get saved into an extra file.
-    save_plot_to_csv : bool
-        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
-
-    Returns
-    -------
-    NOTHING
-    """
-
-    save_plot = True
-    edge_deviation = [[], [], []]
-    deviation = [[], [], []]
-    labels = ["easy", "medium", "hard"]
-    type = "pred_dev"
-
-    # save_seeds check
-    seedfile = None
-    if save_seeds:
-        seedfile = plotting.create_seed_file(type)
-
-    i = 0
-    for label in labels:
-
-        if not (seedfile is None):
-            plotting.write_seed_file(seedfile, label, ["edge pred dev"])
-
-        for j in range(amount_of_graphs):
-
-            print("Analyzing " + label + " graph number " + str(j + 1) + ":\n")
-            print("Deviation: \n" + str(deviation[i]) + "\n")
-
-            G = graphs.create_lfr_graph(label, seedfile)
-
-            separation_nodes_gt, separation_edges_gt = graphs.get_all_separation_nodes_edges_lfr(G)
-
-            nc_values = []
-            gt_values = []
-            for (k, l) in G.edges():
-                node_layer_depth, nodes_in_layers, edges_in_layers, edge_layer_depth, sub_tree_root = nC.bfs(G, k, l)
-                edge_nc, nc = nC.neighborhood_connectivity(G, k, l, edges_in_layers, sub_tree_root, nodes_in_layers,
-                                                           a=0.5)
-                nc_values.append(nc)
-                if (k, l) in separation_edges_gt or (l, k) in separation_edges_gt:
-                    gt_values.append(0)
-                else:
-                    gt_values.append(1)
-
-            edge_deviation[i].append(r2_score(gt_values, nc_values))
-            deviation[i].append(edge_deviation[i][j])
-
-            # save results to seeds file
-            if not (seedfile is None):
-                with open(seedfile, "a") as f:
-                    f.write(f"{str(edge_deviation[i][j]):20}\n")
-
-        i += 1
-
-    plotting.create_box_plot(deviation, labels, save_plot, type)
-
-    # save_plot_to_csv check
-    if save_plot_to_csv:
-        plotting.create_plot_csv_file(type, deviation, labels)
-
-
-def check_surjective_and_injective_correctness(amount_of_graphs=50, iterations=50, save_seeds=True):
-    """
-    Checks a number of randomly generated graphs whether their surjective or injective correctness gets violated
-
-    Parameters
-    ----------
-    amount_of_graphs : int
-        Amount of graphs analyzed for each tier.
-    iterations : int
-        The number of simulated annealing iterations.
-    save_seeds : bool
-        Determines whether the seeds and the results should get saved into an extra file.
-
-    Returns
-    -------
-    NOTHING
-    """
-
-    labels = ["easy", "medium", "hard"]
-    type = "sur_inj_corr"
-
-    # save_seeds check
-    seedfile = None
-    if save_seeds:
-        seedfile = plotting.create_seed_file(type)
-
-    # i = 0
-    for label in labels:
-
-        if not (seedfile is None):
-            plotting.write_seed_file(seedfile, label, ["inj violations", "sur violations", "sep set violations"])
-
-        for j in range(amount_of_graphs):
-
-            print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
-
-            G = graphs.create_lfr_graph(label, seedfile)
-
-            node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations,
-                                                                        draw=False)
-            # communities = nC.greedy_separation_node_classification(G, node_classification)
-            # node_assignments = graphs.assign_nodes_to_coms(G, communities)
-
-            separation_nodes = [i for i in node_classification.keys() if node_classification[i] == 0]
-
-            H = copy.deepcopy(G)
-            for node in separation_nodes:
-                H.remove_node(node)
-            connected_components = [set(cc) for cc in nx.connected_components(H)]
-
-            gt_communities = graphs.get_com_list_from_lfr(G)
-
-            separation_set_constraint_violations = 0
-            for cc in connected_components:
-                intersection_sizes = []
-                for com in gt_communities:
-                    number_of_intersecting_nodes = len(cc.intersection(set(com)))
-                    if number_of_intersecting_nodes > 0:
-                        intersection_sizes.append(number_of_intersecting_nodes)
-                if len(intersection_sizes) > 1:
-                    intersection_sizes.sort()
-                    intersection_sizes.pop()
-                    separation_set_constraint_violations += sum(intersection_sizes)
-
-            surjectivity_violations = 0
-            injectivity_violations = 0
-            for com in gt_communities:
-                intersection_sizes = []
-                for cc in connected_components:
-                    intersection_size = len(set(com).intersection(cc))
-                    if intersection_size > 0:
-                        intersection_sizes.append(len(cc))
-                if len(intersection_sizes) == 0:
-                    surjectivity_violations += 1
-                elif len(intersection_sizes) > 1:
-                    intersection_sizes.sort()
-                    intersection_sizes.pop()
-                    injectivity_violations += sum(intersection_sizes)
-
-            print("\nSeparation node set violations: " + str(separation_set_constraint_violations))
-            print("Surjective violations: " + str(surjectivity_violations))
-            print("Injective violations: " + str(injectivity_violations) + "\n")
-
-            # save results to seeds file
-            if not (seedfile is None):
-                with open(seedfile, "a") as f:
-                    f.write(
-                        f"{str(injectivity_violations):20}{str(surjectivity_violations):20}"
-                        f"{str(separation_set_constraint_violations):20}\n")
-
-
-def intra_probability_SBM_plots(amount_of_graphs=50, simulated_annealing_iterations=1000, save_plot=True,
-                                save_plot_to_csv=True):
-    """
-    Creates a plot that compares the results for three different complexity of SBM graphs with their ground truth.
-
-    Parameters
-    ----------
-    amount_of_graphs : int
-        Amount of graphs analyzed for each tier.
-    simulated_annealing_iterations : int
-        The number of simulated annealing iterations.
-    save_plot : bool
-        Determines whether the resulting plot should be saved or not.
-    save_plot_to_csv : bool
-        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
-
-    Returns
-    -------
-    NOTHING
-    """
-    labels = ["NMI Score", "com size", "bijective viols"]
-
-    intra_probs = [0.3, 0.4, 0.5]
-    n = 250
-    c = 7
-
-    seeds = graphs.create_seed_list(133742072, len(intra_probs) * amount_of_graphs)
-    filenames = []
-
-    for i in range(len(intra_probs)):
-        nmi_score = []
-        nodes_in_cc = []
-        bi_sn_set = []
-
-        results = [nmi_score, nodes_in_cc, bi_sn_set]
-
-        for j in range(amount_of_graphs):
-            print("Run: " + str(j + 1) + ", intra prob: " + str(intra_probs[i]) + ", seed: " + str(
-                seeds[i * amount_of_graphs + j]))
-            try:
-                G = graphs.create_sbm_graph(n=n, c=c, intra_prob=intra_probs[i], seed=seeds[i * amount_of_graphs + j])
-                best, best_eval, best_sep_set_viols, best_sur_viols, best_inj_viols = \
-                    nC.simulated_annealing(G, warmstart=None, n_iterations=simulated_annealing_iterations, temp=100)
-                communities = nC.greedy_separation_node_classification(G, {k: best[k] for k in range(len(best))})
-
-                # nmi score
-                node_assignments = {u: None for u in G.nodes()}
-                for u in G.nodes():
-                    for c, l in communities.items():
-                        if u in l:
-                            node_assignments[u] = c
-
-                nmi_score.append(normalized_mutual_info_score(list(node_assignments.values()),
-                                                              list(nx.get_node_attributes(G, "block").values())))
-
-                # nodes in connected components
-                cc_nodelist = {cc: set() for cc in communities.keys()}
-                for node in G.nodes():
-                    if best[node]:
-                        cc_nodelist[node_assignments[node]].add(node)
-
-                average_cc_length = 0
-                for cc in cc_nodelist:
-                    average_cc_length += len(cc_nodelist[cc]) ** 2
-
-                average_cc_length = math.sqrt(average_cc_length / len(cc_nodelist.keys()))
-                # print("Average: " + str(average_cc_length))
-
-                variance = 0
-                for cc in cc_nodelist:
-                    variance += (len(cc_nodelist[cc]) - average_cc_length) ** 2
-
-                variance = variance / len(cc_nodelist.keys())
-
-                standard_deviation = math.sqrt(variance)
-
-                nodes_in_cc.append(
-                    1 - standard_deviation / average_cc_length)  # normalized by soll size of the communities int(n/c)
-
-                # separation set violations
-                # to quantify injectivity violations: counts the number of nodes besides the biggest intersection with
-                # a community (in absolute node numbers)
-                # to quantify surjectivty: simply count up the mnumber of communities not found
-                bi_sn_set.append(best_inj_viols + best_sur_viols)
-
-            except KeyError:
-                print("KeyError occurred")
-
-        plotting.create_box_plot(results, labels, save_plot, "intra_prob: " + str(intra_probs[i]))
-
-        if save_plot_to_csv:
-            filename = plotting.create_plot_csv_file("intra_prob_" + str(intra_probs[i]), results, labels)
-            filenames.append(filename)
-
-    plotting.combine_box_plots(filenames, save_plot=True)
+import neighborhoodConnectivity as nC
+import networkx as nx
+import graphs
+from sklearn.metrics.cluster import normalized_mutual_info_score
+import numpy as np
+import os
+import random
+import plotting
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.metrics import r2_score
+path = os.path.abspath(os.path.dirname(__file__))
+
+# lfr graphs created in this session, keyed by (label, seed), see _cached_lfr_graphs
+_lfr_graph_cache = {}
+
+# a warm started simulated annealing run may end worse than the previous run by this fraction before the next graph
+# gets analysed from scratch again
+_WARMSTART_TOLERANCE = 0.1
+# number of consecutive SBM graphs of one intra probability that are warm started from each other, fixed so that the
+# results do not depend on the number of available cores
+_SBM_CHAIN_LENGTH = 5
+# attempts to find a minimal separation node set on one graph before a new graph gets generated
+_SEPARATION_SET_RETRIES = 20
+
+# best known modularity values of the real world data sets
+_BEST_MOD = (
+    ("karate", 0.41979),  # number of comm = 4
+    ("dolphins", 0.52852),  # number of comm = 5
+    ("miserables", 0.56001),  # number of comm = 8
+    ("protein", 0.6491),  # number of comm = 7 by mod-max, 10 is ground-truth
+    ("books", 0.52724),  # number of comm = 4?
+    # ("jazz", 0.4452),  # number of comm = 4
+    # ("elegans", 0.4342),  # number of comm = 12
+)
+
+
+def _parallel_map(function, tasks):
+    """
+    Executes function for every task, distributing the independent calls over all available cores.
+
+    Parameters
+    ----------
+    function : callable
+        A module-level function, so that it can be sent to the worker processes.
+    tasks : list
+        The arguments of every call as tuples.
+
+    Returns
+    -------
+    list
+        The results of all calls in the order of tasks.
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(function, *zip(*tasks)))
+
+
+def _create_lfr_graph(label, seed):
+    """
+    Creates the lfr graph of the given complexity deterministically from seed.
+
+    Parameters
+    ----------
+    label : str
+        The complexity of the lfr graph.
+    seed : int
+        The seed the lfr graph gets created from.
+
+    Returns
+    -------
+    tuple
+        The created graph and the seed of the lfr benchmark it was created with.
+    """
+    return graphs.create_lfr_graph(label, return_seed=True, seed=seed)
+
+
+def _cached_lfr_graphs(labels, amount_of_graphs):
+    """
+    Returns the lfr graphs every evaluation of this session analyses. The graphs are created deterministically from the
+    seed list of graphs.create_seed_list, so every graph only gets created once and is then shared by all evaluations.
+    Missing graphs are created in parallel.
+
+    Parameters
+    ----------
+    labels : list
+        The complexities of the lfr graphs.
+    amount_of_graphs : int
+        Amount of graphs for each complexity.
+
+    Returns
+    -------
+    dict
+        For every label a list of (graph, seed) tuples, the seed being the one of the lfr benchmark.
+    """
+    seeds = graphs.create_seed_list(amount_of_seeds=amount_of_graphs)
+    missing = [(label, seed) for label in labels for seed in seeds if (label, seed) not in _lfr_graph_cache]
+    for key, result in zip(missing, _parallel_map(_create_lfr_graph, missing)):
+        _lfr_graph_cache[key] = result
+    return {label: [_lfr_graph_cache[(label, seed)] for seed in seeds] for label in labels}
+
+
+def _overlap_counts(cc_label, gt_label, n_cc, n_gt):
+    """
+    Counts the number of nodes every connected component shares with every ground truth community in a single pass.
+
+    Parameters
+    ----------
+    cc_label : np.array
+        The index of the connected component of every node.
+    gt_label : np.array
+        The index of the ground truth community of every node, in the same node order as cc_label.
+    n_cc : int
+        The number of connected components.
+    n_gt : int
+        The number of ground truth communities.
+
+    Returns
+    -------
+    np.array
+        The overlap matrix, entry [k, l] is the number of nodes in connected component k and community l.
+    """
+    return np.bincount(cc_label * n_gt + gt_label, minlength=n_cc * n_gt).reshape(n_cc, n_gt)
+
+
+def _modularity_run(G, label, j, iterations, verbose=False):
+    """
+    Analyses a real world data set once and calculates the modularity of the found communities.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The data set with its nodes labeled by integers.
+    label : str
+        The name of the data set.
+    j : int
+        The number of the run.
+    iterations : int
+        The number of simulated annealing iterations.
+    verbose : bool
+        If set to True, the result of every run gets printed.
+
+    Returns
+    -------
+    float
+        The modularity of the found communities.
+    """
+    print("Analyzing graph " + label + ", run number " + str(j) + ":\n")
+
+    node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations, draw=False)
+    communities = nC.greedy_separation_node_classification(G, node_classification)
+    node_assignments = graphs.assign_nodes_to_coms(G, communities)
+    modularity = graphs.calculate_modularity(G, node_assignments)
+
+    if verbose:
+        print(f"{label} run {j}: modularity={modularity:.4f}")
+    return modularity
+
+
+def _nmi_run(G, label, j, iterations, verbose=False):
+    """
+    Calculates the normalized mutual information score of the found communities.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The lfr graph to be analysed.
+    label : str
+        The complexity of the lfr graph.
+    j : int
+        The number of the graph.
+    iterations : int
+        The number of simulated annealing iterations.
+    verbose : bool
+        If set to True, the result of every run gets printed.
+
+    Returns
+    -------
+    nmi_score : float
+        The normalized mutual information score compared to the ground truth.
+    """
+    print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
+    com_index_dict = graphs.assign_com_index_ground_truth(G)
+    com_index_arr = np.fromiter(com_index_dict.values(), dtype=np.int32, count=len(com_index_dict))
+
+    node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations, draw=False)
+    communities = nC.greedy_separation_node_classification(G, node_classification)
+    node_assignments = graphs.assign_nodes_to_coms(G, communities)
+    node_assignments_arr = np.fromiter(node_assignments.values(), dtype=np.int32, count=len(node_assignments))
+
+    nmi_score = normalized_mutual_info_score(com_index_arr, node_assignments_arr)
+    if verbose:
+        print(f"{label} run {j}: nmi={nmi_score:.4f}")
+    return nmi_score
+
+
+def _com_run(G, label, j, iterations, verbose=False):
+    """
+    Counts the communities found by the algorithm and in the ground truth.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The lfr graph to be analysed.
+    label : str
+        The complexity of the lfr graph.
+    j : int
+        The number of the graph.
+    iterations : int
+        The number of simulated annealing iterations.
+    verbose : bool
+        If set to True, the result of every run gets printed.
+
+    Returns
+    -------
+    coms_found : int
+        The number of communities found by the algorithm.
+    coms_gt : int
+        The number of communities in the ground truth.
+    """
+    print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
+
+    node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations, draw=False)
+    communities = nC.greedy_separation_node_classification(G, node_classification)
+    # node_assignments = graphs.assign_nodes_to_coms(G, communities)
+
+    coms_found = len(communities.keys())
+    coms_gt = graphs.count_lfr_coms(G)
+    if verbose:
+        print(f"{label} run {j}: coms found={coms_found}, coms gt={coms_gt}")
+    return coms_found, coms_gt
+
+
+def _separation_node_set_run(G, label, j, seed, iterations, verbose=False):
+    """
+    Counts the separation nodes found by the algorithm and in a minimal set of separation
+    nodes.
+
+    If no minimal set is found within _SEPARATION_SET_RETRIES attempts, a new graph of the same complexity is
+    generated deterministically from the seed and analysed instead.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The lfr graph to be analysed.
+    label : str
+        The complexity of the lfr graph.
+    j : int
+        The number of the graph.
+    seed : int
+        The seed the graph was created with.
+    iterations : int
+        The number of simulated annealing iterations.
+    verbose : bool
+        If set to True, the result of every run gets printed.
+
+    Returns
+    -------
+    separation_nodes_count : int
+        The number of separation nodes found by the algorithm.
+    separation_nodes_amount_gt : int
+        The number of separation nodes in the minimal set.
+    seed : int
+        The seed of the analysed graph, differs from the given seed if a new graph had to be generated.
+    """
+    print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
+
+    separation_nodes_amount_gt = 0
+    # replacement graphs are seeded from the seed of the given graph, so repeated runs analyse the same graphs
+    replacement_seeds = random.Random(seed)
+    while True:
+        for _ in range(_SEPARATION_SET_RETRIES):
+            # find_separation_node_set already returns a set, empty if no valid set was found
+            separation_nodes_amount_gt = len(graphs.find_separation_node_set(G))
+            if separation_nodes_amount_gt > 0:
+                break
+            print("Trying to find separation node set.", end="\r")
+
+        if separation_nodes_amount_gt > 0:
+            break
+
+        print("\nNo separation node set found for the " + label + " graph with seed " + str(seed) +
+              ". Creating another graph.")
+        G, seed = _create_lfr_graph(label, replacement_seeds.randint(100000, 999999))
+
+    print("\nThe minimum amount of separation nodes for the graph " + label + " is " + str(
+        separation_nodes_amount_gt))
+
+    node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations, draw=False)
+    # only the separation nodes are counted, no community assignment is needed here
+    separation_nodes_count = sum(1 for classification in node_classification.values() if classification == 0)
+
+    if verbose:
+        print(f"{label} run {j}: separation nodes found={separation_nodes_count}")
+    return separation_nodes_count, separation_nodes_amount_gt, seed
+
+
+def _prediction_run(G, label, j, verbose=False):
+    """
+    Compares the neighborhood connectivity of every edge to whether it is separating.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The lfr graph to be analysed.
+    label : str
+        The complexity of the lfr graph.
+    j : int
+        The number of the graph.
+    verbose : bool
+        If set to True, the result of every run gets printed.
+
+    Returns
+    -------
+    float
+        The r2 score of the edge predictions.
+    """
+    print("Analyzing " + label + " graph number " + str(j + 1) + ":\n")
+
+    separation_nodes_gt, separation_edges_gt = graphs.get_all_separation_nodes_edges_lfr(G)
+
+    # without any separating edge the ground truth is constant and the r2 score is undefined, r2_score would only
+    # return 1.0 if every edge got a neighborhood connectivity of exactly 1 and 0.0 otherwise, so such a graph is scored
+    # as no prediction at all without running bfs for every edge
+    if not separation_edges_gt:
+        if verbose:
+            print(f"{label} run {j}: no separation edges, r2=0.0")
+        return 0.0
+
+    # orientation free, hashed set of the separation edges, so every edge is probed exactly once in O(1)
+    separation_edges_gt = {frozenset(edge) for edge in separation_edges_gt}
+
+    nc_values = np.empty(G.number_of_edges())
+    gt_values = np.empty(G.number_of_edges(), dtype=np.int8)
+    for e, (k, l) in enumerate(G.edges()):
+        node_layer_depth, nodes_in_layers, edges_in_layers, edge_layer_depth, sub_tree_root = nC.bfs(G, k, l)
+        edge_nc, nc = nC.neighborhood_connectivity(G, k, l, edges_in_layers, sub_tree_root, nodes_in_layers, a=0.5)
+        nc_values[e] = nc
+        gt_values[e] = frozenset((k, l)) not in separation_edges_gt
+
+    edge_prediction = r2_score(gt_values, nc_values)
+    if verbose:
+        print(f"{label} run {j}: r2={edge_prediction:.4f}")
+    return edge_prediction
+
+
+def _correctness_run(G, label, j, iterations, verbose=False):
+    """
+    Counts the violations of the separation node set, surjectivity and injectivity constraints of the found separation
+    nodes with respect to the ground truth communities.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The lfr graph to be analysed.
+    label : str
+        The complexity of the lfr graph.
+    j : int
+        The number of the graph.
+    iterations : int
+        The number of simulated annealing iterations.
+    verbose : bool
+        If set to True, the result of every run gets printed.
+
+    Returns
+    -------
+    injectivity_violations : int
+        The number of nodes in connected components besides the biggest one intersecting each community.
+    surjectivity_violations : int
+        The number of communities without any intersecting connected component.
+    separation_set_constraint_violations : int
+        The number of nodes in connected components besides their biggest intersection with a community.
+    """
+    print("Analysing " + label + " graph number " + str(j + 1) + ":\n")
+
+    node_classification = nC.run_separation_node_classification(G, d=2, a=0.5, iterations=iterations, draw=False)
+    # only the separation nodes are needed, no community assignment is computed
+    separation_node_set = {node for node, classification in node_classification.items() if classification == 0}
+    H = G.subgraph([node for node in G.nodes() if node not in separation_node_set])
+    connected_components = [set(cc) for cc in nx.connected_components(H)]
+
+    # ground truth community index of every node, computed once per graph
+    gt_index = graphs.assign_com_index_ground_truth(G)
+    n_gt = max(gt_index.values()) + 1
+
+    # label every remaining node with its connected component and its ground truth community
+    cc_label = np.fromiter((k for k, cc in enumerate(connected_components) for _ in cc), dtype=np.int32)
+    gt_label = np.fromiter((gt_index[node] for cc in connected_components for node in cc), dtype=np.int32)
+    overlap = _overlap_counts(cc_label, gt_label, len(connected_components), n_gt)
+
+    # nodes of a connected component besides its biggest intersection with a community
+    separation_set_constraint_violations = int((overlap.sum(axis=1) - overlap.max(axis=1, initial=0)).sum())
+
+    # communities without any intersecting connected component
+    surjectivity_violations = int(((overlap > 0).sum(axis=0) == 0).sum())
+
+    # sizes of all connected components intersecting a community besides the biggest one
+    intersecting_cc_sizes = np.where(overlap > 0, overlap.sum(axis=1)[:, None], 0)
+    injectivity_violations = int((intersecting_cc_sizes.sum(axis=0) -
+                                  intersecting_cc_sizes.max(axis=0, initial=0)).sum())
+
+    if verbose:
+        print(f"{label} run {j}: separation node set violations={separation_set_constraint_violations}, "
+              f"surjective violations={surjectivity_violations}, "
+              f"injective violations={injectivity_violations}")
+    return injectivity_violations, surjectivity_violations, separation_set_constraint_violations
+
+
+def _intra_probability_SBM_run(n, c, intra_prob, j, seed, simulated_annealing_iterations, warmstart=None):
+    """
+    Creates an SBM graph and analyses the communities found by simulated annealing.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes of the graph.
+    c : int
+        The number of communities of the graph.
+    intra_prob : float
+        The intra community edge probability.
+    j : int
+        The number of the graph.
+    seed : int
+        The seed the graph gets created with.
+    simulated_annealing_iterations : int
+        The number of simulated annealing iterations.
+    warmstart :
+        Bitstring the simulated annealing starts from, None to start from scratch.
+
+    Returns
+    -------
+    scores : tuple or None
+        The NMI score, the community size score and the number of bijective violations.
+        None if a KeyError occurred.
+    best :
+        The best separation node classification found by simulated annealing, None if it did not finish.
+    best_eval : float
+        The objective value of best, None if simulated annealing did not finish.
+    """
+    print("Run: " + str(j + 1) + ", intra prob: " + str(intra_prob) + ", seed: " + str(seed))
+    best, best_eval = None, None
+    try:
+        G = graphs.create_sbm_graph(n=n, c=c, intra_prob=intra_prob, seed=seed)
+        best, best_eval, best_sep_set_viols, best_sur_viols, best_inj_viols = \
+            nC.simulated_annealing(G, warmstart=warmstart, n_iterations=simulated_annealing_iterations, temp=100)
+        communities = nC.greedy_separation_node_classification(G, {k: best[k] for k in range(len(best))})
+
+        indptr, _, com_id = graphs.get_community_csr(communities, G.number_of_nodes())
+
+        # nmi score
+        blocks = nx.get_node_attributes(G, "block")
+        nmi_score = normalized_mutual_info_score(com_id, np.fromiter(blocks.values(), dtype=np.int32,
+                                                                     count=len(blocks)))
+
+        # non-separation nodes per community
+        cc_sizes = np.bincount(com_id[np.asarray(best, dtype=bool)], minlength=len(indptr) - 1).astype(np.float64)
+
+        average_cc_length = np.sqrt(np.mean(cc_sizes ** 2))
+        # print("Average: " + str(average_cc_length))
+
+        standard_deviation = np.sqrt(np.mean((cc_sizes - average_cc_length) ** 2))
+
+        # normalized by soll size of the communities int(n/c)
+        nodes_in_cc = 1 - standard_deviation / average_cc_length
+
+        # separation set violations
+        # to quantify injectivity violations: counts the number of nodes besides the biggest intersection with
+        # a community (in absolute node numbers)
+        # to quantify surjectivty: simply count up the mnumber of communities not found
+        bi_sn_set = best_inj_viols + best_sur_viols
+
+    except KeyError:
+        print("KeyError occurred")
+        return None, best, best_eval
+
+    return (nmi_score, nodes_in_cc, bi_sn_set), best, best_eval
+
+
+def _intra_probability_SBM_chain(n, c, intra_prob, runs, seeds, simulated_annealing_iterations):
+    """
+    Analyses a chain of SBM graphs of the same intra probability. Every graph has the same node to block layout, so
+    simulated annealing starts from the best classification of the previous graph of the chain.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes of the graphs.
+    c : int
+        The number of communities of the graphs.
+    intra_prob : float
+        The intra community edge probability.
+    runs : list
+        The numbers of the graphs in the chain.
+    seeds : list
+        The seeds the graphs get created with.
+    simulated_annealing_iterations : int
+        The number of simulated annealing iterations.
+
+    Returns
+    -------
+    list
+        The scores of every graph as returned by _intra_probability_SBM_run.
+    """
+    # forked pool workers inherit the NumPy random state of the parent and reseed Python's random state from the
+    # system, so every chain reseeds both with the seed of its first graph to keep the bit flips and Metropolis
+    # acceptance draws of different chains independent and reproducible
+    if seeds:
+        random.seed(seeds[0])
+        np.random.seed(seeds[0])
+
+    results = []
+    warmstart, warmstart_eval = None, None
+    for j, seed in zip(runs, seeds):
+        scores, best, best_eval = _intra_probability_SBM_run(n, c, intra_prob, j, seed, simulated_annealing_iterations,
+                                                             warmstart)
+        results.append(scores)
+
+        # fall back to a cold start if the warm start did not finish or clearly made the solution worse
+        if best is None or (warmstart_eval is not None and
+                            best_eval > warmstart_eval + _WARMSTART_TOLERANCE * abs(warmstart_eval)):
+            warmstart, warmstart_eval = None, None
+        else:
+            warmstart, warmstart_eval = best, best_eval
+    return results
+
+
+def modularity_deviation(number_of_runs=50, iterations=50, save_plot_to_csv=True, verbose=False):
+    """
+    Creates a plot that compares the results for real world data sets to their best known modularity values.
+
+    Parameters
+    ----------
+    number_of_runs : int
+        Determines how often each graph will be analysed.
+    iterations : int
+        The number of simulated annealing iterations.
+    save_plot_to_csv : bool
+        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
+    verbose : bool
+        If set to True, the result of every single run gets printed.
+
+    Returns
+    -------
+    NOTHING
+    """
+    save_plot = True
+    type = "mod_dev"
+
+    labels = [label for label, _ in _BEST_MOD]
+
+    # parse every data set only once, the workers receive copies of the parsed graphs
+    data_sets = {}
+    for label in labels:
+        G = nx.read_gml(os.path.join(path, 'graphs', label + '.gml'))
+        data_sets[label] = nx.relabel.convert_node_labels_to_integers(G)
+
+    tasks = [(data_sets[label], label, j, iterations, verbose) for label in labels for j in range(number_of_runs)]
+    modularities = _parallel_map(_modularity_run, tasks)
+
+    # one row of deviations per data set
+    deviation = np.empty((len(labels), number_of_runs))
+    for i, (label, best) in enumerate(_BEST_MOD):
+        deviation[i, :] = modularities[i * number_of_runs:(i + 1) * number_of_runs]
+        deviation[i, :] /= best
+
+        print("Best known Modularity for " + label + " is: " + str(best))
+        print(label + " deviation: " + str(deviation[i]))
+
+    plotting.create_box_plot(list(deviation), labels, save_plot, type, y_axis="Deviation in %")
+
+    # save_plot_to_csv check
+    if save_plot_to_csv:
+        _ = plotting.create_plot_csv_file(type, list(deviation), labels)
+
+
+def nmi_deviation(amount_of_graphs=50, iterations=50, save_seeds=True, save_plot_to_csv=True, verbose=False):
+    """
+    Creates a plot that compares the results for three different complexity of lfr graphs with their ground truth.
+
+    Parameters
+    ----------
+    amount_of_graphs : int
+        Amount of graphs analyzed for each tier.
+    iterations : int
+        The number of simulated annealing iterations.
+    save_seeds : bool
+        Determines whether the seeds and the results should get saved into an extra file.
+    save_plot_to_csv : bool
+        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
+    verbose : bool
+        If set to True, the result of every single run gets printed.
+
+    Returns
+    -------
+    NOTHING
+    """
+    save_plot = True
+    labels = ["easy", "medium", "hard"]
+    deviation = np.empty((len(labels), amount_of_graphs))
+    type = "nmi_dev"
+
+    # save_seeds check
+    with (plotting.SeedLog(type) if save_seeds else contextlib.nullcontext()) as seedlog:
+        lfr_graphs = _cached_lfr_graphs(labels, amount_of_graphs)
+        tasks = [(G, label, j, iterations, verbose) for label in labels for j, (G, _) in enumerate(lfr_graphs[label])]
+        results = _parallel_map(_nmi_run, tasks)
+
+        for i, label in enumerate(labels):
+
+            if not (seedlog is None):
+                seedlog.header(label, ["normalized mutual information score"])
+
+            label_results = results[i * amount_of_graphs:(i + 1) * amount_of_graphs]
+            deviation[i, :] = label_results
+
+            # save results to seeds file
+            if not (seedlog is None):
+                for (_, seed), nmi_score in zip(lfr_graphs[label], label_results):
+                    seedlog.row(seed, nmi_score)
+
+            print(label + " NMI scores: " + str(deviation[i]))
+
+    plotting.create_box_plot(list(deviation), labels, save_plot, type, y_axis="NMI score")
+
+    # save_plot_to_csv check
+    if save_plot_to_csv:
+        _ = plotting.create_plot_csv_file(type, list(deviation), labels)
+
+
+def com_deviation(amount_of_graphs=50, iterations=50, save_seeds=True, save_plot_to_csv=True, verbose=False):
+    """
+    Creates a plot that compares the number of communities found by the algorithm to the actual ground truth number of
+    communities.
+
+    Parameters
+    ----------
+    amount_of_graphs : int
+        Amount of graphs analyzed for each tier.
+    iterations : int
+        The number of simulated annealing iterations.
+    save_seeds : bool
+        Determines whether the seeds and the results should get saved into an extra file.
+    save_plot_to_csv : bool
+        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
+    verbose : bool
+        If set to True, the result of every single run gets printed.
+
+    Returns
+    -------
+    NOTHING
+    """
+    save_plot = True
+    labels = ["easy", "medium", "hard"]
+    deviation = np.empty((len(labels), amount_of_graphs))
+    type = "com_dev"
+
+    # save_seeds check
+    with (plotting.SeedLog(type) if save_seeds else contextlib.nullcontext()) as seedlog:
+        lfr_graphs = _cached_lfr_graphs(labels, amount_of_graphs)
+        tasks = [(G, label, j, iterations, verbose) for label in labels for j, (G, _) in enumerate(lfr_graphs[label])]
+        results = _parallel_map(_com_run, tasks)
+
+        for i, label in enumerate(labels):
+
+            if not (seedlog is None):
+                seedlog.header(label, ["coms found", "coms ground truth", "deviation"])
+
+            label_results = results[i * amount_of_graphs:(i + 1) * amount_of_graphs]
+            for j, (coms_found, coms_gt) in enumerate(label_results):
+                deviation[i, j] = coms_found / coms_gt
+
+            # save results to seeds file
+            if not (seedlog is None):
+                for (_, seed), (coms_found, coms_gt), com_deviation in zip(lfr_graphs[label], label_results,
+                                                                           deviation[i]):
+                    seedlog.row(seed, coms_found, coms_gt, com_deviation)
+
+            print(label + " deviation: " + str(deviation[i]))
+
+    plotting.create_box_plot(list(deviation), labels, save_plot, type, y_axis="Deviation")
+
+    # save_plot_to_csv check
+    if save_plot_to_csv:
+        _ = plotting.create_plot_csv_file(type, list(deviation), labels)
+
+
+def separation_node_set_deviation(amount_of_graphs=50, iterations=50, save_seeds=True, save_plot_to_csv=True,
+                                  verbose=False):
+    """
+    Creates a plot that compares the number of separation nodes found by the algorithm to the minimum set of optimal
+    separation nodes.
+
+    Parameters
+    ----------
+    amount_of_graphs : int
+        Amount of graphs analyzed for each tier.
+    iterations : int
+        The number of simulated annealing iterations.
+    save_seeds : bool
+        Determines whether the seeds and the results should get saved into an extra file.
+    save_plot_to_csv : bool
+        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
+    verbose : bool
+        If set to True, the result of every single run gets printed.
+
+    Returns
+    -------
+    NOTHING
+    """
+    save_plot = True
+    labels = ["easy", "medium", "hard"]
+    deviation = np.empty((len(labels), amount_of_graphs))
+    type = "sep_nodes_dev"
+
+    # save_seeds check
+    with (plotting.SeedLog(type) if save_seeds else contextlib.nullcontext()) as seedlog:
+        lfr_graphs = _cached_lfr_graphs(labels, amount_of_graphs)
+        tasks = [(G, label, j, seed, iterations, verbose) for label in labels
+                 for j, (G, seed) in enumerate(lfr_graphs[label])]
+        results = _parallel_map(_separation_node_set_run, tasks)
+
+        for i, label in enumerate(labels):
+
+            if not (seedlog is None):
+                seedlog.header(label, ["sep nodes found", "sep nodes gt", "deviation"])
+
+            label_results = results[i * amount_of_graphs:(i + 1) * amount_of_graphs]
+            for j, (separation_nodes_count, separation_nodes_amount_gt, _) in enumerate(label_results):
+                deviation[i, j] = separation_nodes_count / separation_nodes_amount_gt
+
+            # save results to seeds file
+            if not (seedlog is None):
+                # the seed reported by the worker, in case the cached graph had to be replaced
+                for (separation_nodes_count, separation_nodes_amount_gt, seed), separation_node_deviation in \
+                        zip(label_results, deviation[i]):
+                    seedlog.row(seed, separation_nodes_count, separation_nodes_amount_gt, separation_node_deviation)
+
+            print(label + " deviation: " + str(deviation[i]))
+
+    plotting.create_box_plot(list(deviation), labels, save_plot, type, y_axis="Deviation")
+
+    # save_plot_to_csv check
+    if save_plot_to_csv:
+        _ = plotting.create_plot_csv_file(type, list(deviation), labels)
+
+
+def prediction_deviation(amount_of_graphs=50, save_seeds=True, save_plot_to_csv=True, verbose=False):
+    """
+    Creates a plot that compares the prediction for nodes/edges to whether they are actually separating
+    (0 is random guessing and 1 would always be correct)
+
+    Parameters
+    ----------
+    amount_of_graphs : int
+        Amount of graphs analyzed for each tier.
+    save_seeds : bool
+        Determines whether the seeds and the results should get saved into an extra file.
+    save_plot_to_csv : bool
+        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
+    verbose : bool
+        If set to True, the result of every single run gets printed.
+
+    Returns
+    -------
+    NOTHING
+    """
+
+    save_plot = True
+    labels = ["easy", "medium", "hard"]
+    deviation = np.empty((len(labels), amount_of_graphs))
+    type = "pred_dev"
+
+    # save_seeds check
+    with (plotting.SeedLog(type) if save_seeds else contextlib.nullcontext()) as seedlog:
+        lfr_graphs = _cached_lfr_graphs(labels, amount_of_graphs)
+        tasks = [(G, label, j, verbose) for label in labels for j, (G, _) in enumerate(lfr_graphs[label])]
+        results = _parallel_map(_prediction_run, tasks)
+
+        for i, label in enumerate(labels):
+
+            if not (seedlog is None):
+                seedlog.header(label, ["edge pred dev"])
+
+            label_results = results[i * amount_of_graphs:(i + 1) * amount_of_graphs]
+            deviation[i, :] = label_results
+
+            # save results to seeds file
+            if not (seedlog is None):
+                for (_, seed), edge_prediction in zip(lfr_graphs[label], label_results):
+                    seedlog.row(seed, edge_prediction)
+
+            print(label + " deviation: " + str(deviation[i]))
+
+    plotting.create_box_plot(list(deviation), labels, save_plot, type)
+
+    # save_plot_to_csv check
+    if save_plot_to_csv:
+        plotting.create_plot_csv_file(type, list(deviation), labels)
+
+
+def check_surjective_and_injective_correctness(amount_of_graphs=50, iterations=50, save_seeds=True, verbose=False):
+    """
+    Checks a number of randomly generated graphs whether their surjective or injective correctness gets violated
+
+    Parameters
+    ----------
+    amount_of_graphs : int
+        Amount of graphs analyzed for each tier.
+    iterations : int
+        The number of simulated annealing iterations.
+    save_seeds : bool
+        Determines whether the seeds and the results should get saved into an extra file.
+    verbose : bool
+        If set to True, the result of every single run gets printed.
+
+    Returns
+    -------
+    NOTHING
+    """
+
+    labels = ["easy", "medium", "hard"]
+    type = "sur_inj_corr"
+
+    # save_seeds check
+    with (plotting.SeedLog(type) if save_seeds else contextlib.nullcontext()) as seedlog:
+        lfr_graphs = _cached_lfr_graphs(labels, amount_of_graphs)
+        tasks = [(G, label, j, iterations, verbose) for label in labels for j, (G, _) in enumerate(lfr_graphs[label])]
+        results = _parallel_map(_correctness_run, tasks)
+
+        for i, label in enumerate(labels):
+
+            if not (seedlog is None):
+                seedlog.header(label, ["inj violations", "sur violations", "sep set violations"])
+
+            label_results = results[i * amount_of_graphs:(i + 1) * amount_of_graphs]
+
+            # save results to seeds file
+            if not (seedlog is None):
+                for (_, seed), violations in zip(lfr_graphs[label], label_results):
+                    seedlog.row(seed, *violations)
+
+
+def intra_probability_SBM_plots(amount_of_graphs=50, simulated_annealing_iterations=1000, save_plot=True,
+                                save_plot_to_csv=True):
+    """
+    Creates a plot that compares the results for three different complexity of SBM graphs with their ground truth.
+
+    Parameters
+    ----------
+    amount_of_graphs : int
+        Amount of graphs analyzed for each tier.
+    simulated_annealing_iterations : int
+        The number of simulated annealing iterations.
+    save_plot : bool
+        Determines whether the resulting plot should be saved or not.
+    save_plot_to_csv : bool
+        Determines whether the data used to create the plot should be saved as a csv file to be recreated.
+
+    Returns
+    -------
+    NOTHING
+    """
+    labels = ["NMI Score", "com size", "bijective viols"]
+
+    intra_probs = [0.3, 0.4, 0.5]
+    n = 250
+    c = 7
+
+    seeds = graphs.create_seed_list(133742072, len(intra_probs) * amount_of_graphs)
+    filenames = []
+
+    # split the graphs of every intra probability into warm started chains of fixed length, only the scheduling of the
+    # chains onto the pool depends on the number of available cores
+    chains = [(i, np.arange(k, min(k + _SBM_CHAIN_LENGTH, amount_of_graphs))) for i in range(len(intra_probs))
+              for k in range(0, amount_of_graphs, _SBM_CHAIN_LENGTH)]
+    tasks = [(n, c, intra_probs[i], chain.tolist(), [seeds[i * amount_of_graphs + j] for j in chain],
+              simulated_annealing_iterations) for i, chain in chains]
+    runs = [scores for chain_results in _parallel_map(_intra_probability_SBM_chain, tasks) for scores in chain_results]
+
+    for i in range(len(intra_probs)):
+        nmi_score = []
+        nodes_in_cc = []
+        bi_sn_set = []
+
+        results = [nmi_score, nodes_in_cc, bi_sn_set]
+
+        for run in runs[i * amount_of_graphs:(i + 1) * amount_of_graphs]:
+            if run is not None:
+                nmi_score.append(run[0])
+                nodes_in_cc.append(run[1])
+                bi_sn_set.append(run[2])
+
+        plotting.create_box_plot(results, labels, save_plot, "intra_prob: " + str(intra_probs[i]))
+
+        if save_plot_to_csv:
+            filename = plotting.create_plot_csv_file("intra_prob_" + str(intra_probs[i]), results, labels)
+            filenames.append(filename)
+
+    plotting.combine_box_plots(filenames, save_plot=True)
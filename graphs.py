@@ -1,504 +1,786 @@
-import os
-import networkx as nx
-import numpy as np
-from networkx.generators.community import LFR_benchmark_graph
-import random
-import datetime
-from collections import Counter
-import ast
-import copy
-import neighborhoodConnectivity
-
-path = os.path.abspath(os.path.dirname(__file__))
-
-
-def create_lfr_graph(diff="default", filename=None):
-    """
-    Creates an lfr graph with the desired complexity. 
-    Depending on the parameters this might take a while.
-    The graph will always be connected.
-
-    Parameters
-    ----------
-    diff : String
-        Determines the complexity of the created graph. "easy", "medium" or "hard". 
-        Otherwise a default graph will be created.
-    filename : String
-        If a filename is given the seed will be saved in the file.
-
-    Returns
-    -------
-    G : networkx.classes.graph.Graph
-        The created lfr graph.
-    """
-    G = None
-    seed = None
-    connected = False
-    i = 0
-    print("Trying to create a graph of the complexity " + diff + ".\nTry number:")
-    while G is None or not connected:
-        seed = create_random_seed()
-        i += 1
-        print(f"{str(i):10}", end="\r")  # + "Seed: " + str(seed))
-        try:
-            if diff == "easy" or diff == "lfr_easy":
-                G = create_lfr_benchmark_graph(n=50, tau1=4, tau2=3, mu=0.05, max_degree=20, min_community=10,
-                                               max_community=15, seed=seed, file_name=path + '/graphs/lfr_easy.gml')
-            elif diff == "medium" or diff == "lfr_medium":
-                G = create_lfr_benchmark_graph(n=65, tau1=5, tau2=3, mu=0.065, max_degree=20, min_community=8,
-                                               max_community=13, seed=seed, file_name=path + '/graphs/lfr_medium.gml')
-            elif diff == "hard" or diff == "lfr_hard":
-                G = create_lfr_benchmark_graph(n=80, tau1=6.5, tau2=1.5, mu=0.08, max_degree=20, min_community=7,
-                                               max_community=11, seed=seed, file_name=path + '/graphs/lfr_hard".gml')
-            elif diff == "test":
-                G = create_lfr_benchmark_graph(n=80, tau1=6.5, tau2=1.5, mu=0.08, max_degree=20, min_community=7,
-                                               max_community=11, seed=seed, file_name=path + '/graphs/lfr_test.gml')
-            else:
-                print("No correct benchmark given!")
-
-        except nx.exception.ExceededMaxIterations:
-            pass
-
-        if not (G is None):
-            connected = nx.is_connected(G)
-            if not connected:
-                print("Graph is not connected. Creating another graph.") 
-                G = None
-
-    if not (filename is None):
-        with open(filename, "a") as f:
-            f.write(f"{str(seed):15}")
-
-    return G
-
-
-def create_sbm_graph(n=400, c=10, intra_prob=0.375, seed=None):
-    inter_prob = 1 - intra_prob
-    sizes = [int(n/c)] * c  # equally sized communities
-    # edge connection probabilities for sbm, 1/2 is for nullifying double counting from symmetry of the matrix:
-    probs = [[1/2 * inter_prob/(c-1) if i != j else intra_prob for j in range(c)] for i in range(c)]
-    G = nx.stochastic_block_model(sizes, probs, seed=seed)
-    return G
-
-
-def create_lfr_benchmark_graph(n=100, tau1=3, tau2=2, mu=0.05, average_degree=10, max_degree=30, min_community=20,
-                               max_community=100, seed=None, file_name=None):
-    """Creates a sample LFR benchmark graph. Saves it as a .gml file if a file_name is specified.
-
-    Parameters
-    ----------
-    n : int, optional
-        Number of nodes in the graph.
-    tau1 : float, optional
-        Power law exponent for the degree distribution of the created
-        graph. This value must be strictly greater than one.
-    tau2 : float, optional
-        Power law exponent for the community size distribution in the
-        created graph. This value must be strictly greater than one.
-    mu : float, optional
-        Fraction of inter-community edges incident to each node. This
-        value must be in the interval [0, 1].
-    average_degree : float, optional
-        Desired average degree of nodes in the created graph. This value
-        must be in the interval [0, *n*]. Exactly one of this and
-        ``min_degree`` must be specified, otherwise a
-        :exc:`NetworkXError` is raised.
-    max_degree : int, optional
-        Maximum degree of nodes in the created graph. If not specified,
-        this is set to ``n``, the total number of nodes in the graph.
-    min_community : int, optional
-        Minimum size of communities in the graph. If not specified, this
-        is set to ``min_degree``.
-    max_community : int, optional
-        Maximum size of communities in the graph. If not specified, this
-        is set to ``n``, the total number of nodes in the graph.
-    seed : integer, random_state, or None (default)
-        Indicator of random number generation state.
-    file_name : str, optional
-        If specified, a .gml of the generated LFR benchmark graph will be saved under this file name.
-
-    Returns
-    -------
-    networkx.classes.graph.Graph
-        The LFR benchmark graph as a networkx graph object. The community structure gets encoded as a node attribute
-        under the name of "ground_truth_community".
-    """
-    G = LFR_benchmark_graph(n, tau1, tau2, mu, max_degree=max_degree, average_degree=average_degree,
-                            min_community=min_community, max_community=max_community, seed=seed)
-    G.remove_edges_from(nx.selfloop_edges(G))
-    nx.set_node_attributes(G, {v: str(G.nodes[v]["community"]) for v in G.nodes()}, "ground_truth_community")
-    for v in G.nodes():
-        del G.nodes[v]["community"]
-    if file_name is not None:
-        nx.write_gml(G, file_name)
-    print('G.nodes: ' + str(G.nodes))
-    return G
-
-
-def create_random_seed(low_end=100000, high_end=999999):
-    random.seed(datetime.datetime.now())
-    rand_seed = random.randint(low_end, high_end)
-    return rand_seed
-
-
-def create_seed_list(seed=694201337, amount_of_seeds=50, low_end=100000, high_end=999999):
-    random.seed(seed)
-    seeds = []
-    for i in range(amount_of_seeds):
-        seeds.append(random.randrange(low_end, high_end))
-    return seeds
-
-
-def assign_com_index_ground_truth(G):
-    """ 
-    Analyzes the ground truth of an lfr graph and assigns each node a community index.
-
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed. Has to be an lfr graph with ground truth.
-    
-    Returns
-    -------
-    dict
-        The assignments of nodes to community indices.
-    """
-    ground_truth = nx.get_node_attributes(G, "ground_truth_community")
-    communities = []
-    assignment_index = {}
-
-    for key in ground_truth:
-
-        if ground_truth[key] in communities:
-            index = communities.index(ground_truth[key])
-            assignment_index.update({key: index})
-
-        else:
-            communities.append(ground_truth[key])
-            index = communities.index(ground_truth[key])
-            assignment_index.update({key: index})
-        
-    return assignment_index
-
-
-def count_lfr_coms(G):
-    """
-    Counts the number of communities for an lfr graph with ground truth.
-
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed. Has to be an lfr graph with ground truth.
-    
-    Returns
-    -------
-    int
-        The number of communities in the graph.
-    """
-    ground_truth = nx.get_node_attributes(G, "ground_truth_community")
-    coms = Counter(ground_truth.values())
-    com_amounts = len(coms)
-    return com_amounts
-
-
-def get_com_list_from_lfr(G):
-    """ 
-    Analyzes the ground truth of an lfr graph and returns a list of all communities as lists.
-
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed. Has to be an lfr graph with ground truth.
-    
-    Returns
-    -------
-    list
-        A list of all communities.
-    """
-
-    ground_truth = nx.get_node_attributes(G, "ground_truth_community")
-    communities = []
-    for key in ground_truth:
-        if list(eval(ground_truth[key])) not in communities:
-            communities.append(list(eval(ground_truth[key])))
-
-    return communities
-
-
-def assign_nodes_to_coms(G, communities):
-    """
-    Calculates the modularity of the graph g using the assignments of all
-    nodes to their community.
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed.
-    communities : dict
-        All communities in the graph keyed by their index.
-    
-    Returns
-    -------
-    node_assignments : dict
-        A dictionary keyed by every node with their community index as their value
-    """
-    node_assignments = {i: None for i in G.nodes()}
-    for i in G.nodes():
-        for j, c in communities.items():
-            if i in c:
-                node_assignments[i] = j
-    return node_assignments
-
-
-def calculate_modularity(G, node_assignments):
-    """
-    Calculates the modularity of the graph g using the assignments of all
-    nodes to their community.
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed.
-    node_assignments : dict
-        The community assignments of the nodes keyed by the node index.
-        Form: {node: community_assignment}
-    
-    Returns
-    -------
-    float
-        The modularity of graph g with its nodes assigned to communities as
-        described in node_assignments.
-    """
-    community_buckets = {community_index: set() for community_index in set(node_assignments.values())}
-    for node, community_index in node_assignments.items():
-        community_buckets[community_index].add(node)
-    communities = list(community_buckets.values())
-    return nx.algorithms.community.modularity(G, communities)
-
-
-def find_separation_node_set(G, iterations=1, file_name=None):
-    """
-    Searches for a set of separator-nodes for the given input graph.
-    Returns the empty set if no such set was found.
-
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to analyse. Has to include node attributes named "ground_truth_community" specifying the community of
-        each node via the set all nodes in that nodes community.
-    iterations : int, optional
-        Number of solutions to be fetched from the QUBO solver.
-    file_name : str, optional
-        If a suitable set of nodes was found, and a file name was specified, the resulting graph (with node attributes
-        flagging the computed separation-node set) gets stored.
-
-    Returns
-    -------
-    set
-        A set of separator-nodes. Set is empty if no adequate set was found. An adequate set is defined as a bijective
-        separator-node set.
-    """
-    n = G.number_of_nodes()
-    q = np.zeros((n, n))
-    communities = {v: G.nodes[v]["ground_truth_community"] for v in G.nodes()}
-    node_list = list(G.nodes)
-    numbering = {node_list[i]: i for i in range(len(node_list))}
-    for i in G.nodes:
-        q[numbering[i]][numbering[i]] = -1
-    for (i, j) in G.edges:
-        q[numbering[i]][numbering[j]] = 0 if communities[i] == communities[j] else 20
-    solution = neighborhoodConnectivity.solve(q, iterations)
-    node_list = list(G.nodes)
-    reverse_numbering = {i: node_list[i] for i in range(n)}  # was range(len(node_list)) instead of n
-    node_assignments = {reverse_numbering[index]: classification for index, classification in solution.items()}
-    identified_nodes = [v for v in node_assignments if node_assignments[v] == 0]
-
-    # check if the identified nodes actually form a set of separator-nodes.
-    H = copy.deepcopy(G)
-    H.remove_nodes_from(identified_nodes)
-    connected_components = [list(cc) for cc in list(nx.algorithms.components.connected.connected_components(H))]
-
-    gt_communities = []
-    for com in set(communities.values()):
-        gt_communities.append({node for node in ast.literal_eval(com)})
-    connected_components = [set(cc) for cc in connected_components]
-    # check separation-node set property of the connected components
-    # in other words: check if each connected component is subset of exactly one ground truth community
-
-    for cc in connected_components:
-        cc = {int(x) for x in cc}
-        alright = False
-        for com in gt_communities:
-            if cc.issubset(com):
-                if not alright:
-                    alright = True
-                    break
-                else:
-                    print('The calculated set is not a set of separation-nodes!'
-                          '\nA node was part of multiple communities.')
-                    print("Calculated set:\n" + str(identified_nodes))
-                    return set()
-        if not alright:
-            print('The calculated set is not a set of separation-nodes!')
-            print("Calculated set: " + str(identified_nodes))
-            return set()
-    # check bijectivity of the corresponding refinement map
-    # in other words: check if each ground truth community is superset of exactly one connected component
-    for com in gt_communities:
-        alright = False
-        for cc in connected_components:
-            cc = {int(x) for x in cc}
-            if com.issuperset(cc):
-                if not alright:
-                    alright = True
-                else:
-                    print('The calculated set is not a bijective set of separation-nodes!2')
-                    print("Calculated set: " + str(identified_nodes))
-                    return set()
-        if not alright:
-            print('The calculated set is not a bijective set of separation-nodes!1')
-            print("Calculated set: " + str(identified_nodes))
-            return set()
-
-    identified_nodes = set(identified_nodes)
-    print('\nFollowing set of separator-nodes was found: ' + str(identified_nodes))
-    # set node attributes for G
-    attrs = {node: {'separation_node': (node in identified_nodes)} for node in G.nodes}
-    nx.set_node_attributes(G, attrs)
-    if file_name is not None:
-        nx.write_gml(G, file_name)
-    calculate_core_nodes(H)
-    return identified_nodes
-
-
-def calculate_core_nodes(G):
-    """
-    Calculates the set of core-nodes. (Also prints the number of core-nodes.)
-
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to analyse. Has to include node attributes named "ground_truth_community" specifying the community of
-        each node via the set all nodes in that nodes community.
-
-    Returns
-    -------
-    set
-        The set of core-nodes.
-    """
-    communities = {v: G.nodes[v]["ground_truth_community"] for v in G.nodes()}
-    number_of_core_nodes = 0
-
-    for v in G.nodes():
-        is_core_node = True
-        for w in G.adj[v]:
-            if communities[v] != communities[w]:
-                is_core_node = False
-                break
-        if is_core_node:
-            number_of_core_nodes += 1
-    print('number_of_core_nodes: ' + str(number_of_core_nodes))
-    print('number_of_border_nodes: ' + str(G.number_of_nodes() - number_of_core_nodes))
-
-
-def find_constraint_violations(G, x: list):
-    """
-    Finds separation node constraints in a given set of separation nodes.
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed.
-    x : list
-        The separation node classification of every node.
-        0 corresponds to a separation node, all other nodes are assigned with 1.
-    
-    Returns
-    -------
-    separation_set_constraint_violations : int
-        The amount of separation nodes set constraint violations.
-    injectivity_violations : int
-        The amount of injectivity constraint violations.
-    surjectivity_violations : int
-        The amount of surjectivity constraint violations.
-    """
-    separation_node_set = [i for i in G.nodes() if x[i] == 0]
-    H = copy.deepcopy(G)
-    H.remove_nodes_from(separation_node_set)
-    connected_components = [set(cc) for cc in nx.connected_components(H)]
-        
-    gt_communities = []
-    for com in set(nx.get_node_attributes(G, "block").values()):
-        gt_communities.append({i for i in G.nodes() if G.nodes[i]["block"] == com})
-    
-    # check separation-node set property of the connected components
-    # in other words: check if each connected component is subset of exactly one ground truth community
-    # in order to quantify violations, count the number of nodes that are part of a connected component lying in a
-    # different than the biggest community intersection (in absolute node count)
-    separation_set_constraint_violations = 0    
-    for cc in connected_components:
-        intersection_sizes = []
-        for com in gt_communities:
-            number_of_intersecting_nodes = len(cc.intersection(com))
-            if number_of_intersecting_nodes > 0:
-                intersection_sizes.append(number_of_intersecting_nodes)
-        if len(intersection_sizes) > 1:
-            intersection_sizes.sort()
-            intersection_sizes.pop()
-            # the number of all nodes not belonging to the community with the biggest intersection:
-            separation_set_constraint_violations += sum(intersection_sizes)
-    # check bijectivity of the corresponding refinement map
-    # in other words: check if each ground truth community is superset of exactly one connected component
-    # to quantify injectivity violations: counts the number of nodes besides the biggest intersection with a community
-    # (in absolute node numbers)
-    # to quantify surjectivty: simply count up the number of communities not found
-    surjectivity_violations = 0
-    injectivity_violations = 0
-    for com in gt_communities:
-        intersection_sizes = []
-        for cc in connected_components:
-            intersection_size = len(com.intersection(cc))
-            if intersection_size > 0:
-                intersection_sizes.append(len(cc))
-        if len(intersection_sizes) == 0:
-            surjectivity_violations += 1
-        elif len(intersection_sizes) > 1:
-            intersection_sizes.sort()
-            intersection_sizes.pop()
-            injectivity_violations += sum(intersection_sizes)
-    return separation_set_constraint_violations, injectivity_violations, surjectivity_violations
-
-
-def get_all_separation_nodes_edges_lfr(G):
-    """
-    Gets every separation node and edge from an lfr graph with ground truth.
-
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed. Has to be an lfr graph with ground truth.
-
-    Returns
-    -------
-    separation_nodes : list
-        A list of all the separation nodes in the graph.
-    separation_edges : list
-        A list of all the separation edges in the graph.
-    """
-
-    com_index_gt = assign_com_index_ground_truth(G)
-
-    separation_nodes = []
-    separation_edges = []
-
-    for (i, j) in G.edges:
-        if com_index_gt[i] != com_index_gt[j]:
-
-            separation_edges.append((i, j))
-
-            if i not in separation_nodes:
-                separation_nodes.append(i)
-            if j not in separation_nodes:
-                separation_nodes.append(j)
-
-    return separation_nodes, separation_edges
+import os
+import networkx as nx
+import numpy as np
+import random
+from collections import Counter, defaultdict
+import weakref
+from itertools import chain
+
+path = os.path.abspath(os.path.dirname(__file__))
+
+# source of fresh seeds, drawn from the operating system so the global random state stays untouched and forked worker
+# processes do not share a generator state
+_seed_rng = random.SystemRandom()
+
+# ground truth communities of every analysed graph per attribute, dropped together with the graph
+_community_sets_cache = weakref.WeakKeyDictionary()
+
+
+def create_lfr_graph(diff="default", filename=None, return_seed=False, seed=None):
+    """
+    Creates an lfr graph with the desired complexity. 
+    Depending on the parameters this might take a while.
+    The graph will always be connected.
+
+    Parameters
+    ----------
+    diff : String
+        Determines the complexity of the created graph. "easy", "medium" or "hard". 
+        Otherwise a default graph will be created.
+    filename : String
+        If a filename is given the seed will be saved in the file.
+    return_seed : bool
+        If set to True, the seed of the created graph is returned as well.
+    seed : int, optional
+        If given, the graph is created deterministically: the seeds tried for the lfr benchmark are drawn from a
+        random number generator initialized with this seed instead of random ones. The graph is then also cached in
+        ".../graphs/cache/lfr_<diff>_<seed>.gml" and loaded from there by later calls with the same complexity and seed.
+
+    Returns
+    -------
+    G : networkx.classes.graph.Graph
+        The created lfr graph.
+    seed : int
+        The seed the graph was created with. Only returned if return_seed is set to True.
+    """
+    # seeded graphs are deterministic, so they are cached on disk keyed by their complexity and seed
+    cache_file = None
+    if seed is not None:
+        name = diff[len("lfr_"):] if diff.startswith("lfr_") else diff
+        cache_file = os.path.join(path, "graphs", "cache", "lfr_" + name + "_" + str(seed) + ".gml")
+        if os.path.exists(cache_file):
+            print("Loading the graph of the complexity " + diff + " for seed " + str(seed) + " from the cache.")
+            G = nx.read_gml(cache_file, destringizer=int)
+            return _return_lfr_graph(G, G.graph["seed"], filename, return_seed)
+
+    G = None
+    rng = None if seed is None else random.Random(seed)
+    connected = False
+    i = 0
+    print("Trying to create a graph of the complexity " + diff + ".\nTry number:")
+    while G is None or not connected:
+        seed = create_random_seed() if rng is None else rng.randint(100000, 999999)
+        i += 1
+        # rejected seeds can add up to thousands of tries, only report the progress every 32 tries
+        if i == 1 or i % 32 == 0:
+            print(f"{str(i):10}", end="\r")  # + "Seed: " + str(seed))
+        try:
+            # the .gml file is only written for the accepted graph, rejected graphs are not serialized
+            if diff == "easy" or diff == "lfr_easy":
+                G = create_lfr_benchmark_graph(n=50, tau1=4, tau2=3, mu=0.05, max_degree=20, min_community=10,
+                                               max_community=15, seed=seed)
+                gml_file = path + '/graphs/lfr_easy.gml'
+            elif diff == "medium" or diff == "lfr_medium":
+                G = create_lfr_benchmark_graph(n=65, tau1=5, tau2=3, mu=0.065, max_degree=20, min_community=8,
+                                               max_community=13, seed=seed)
+                gml_file = path + '/graphs/lfr_medium.gml'
+            elif diff == "hard" or diff == "lfr_hard":
+                G = create_lfr_benchmark_graph(n=80, tau1=6.5, tau2=1.5, mu=0.08, max_degree=20, min_community=7,
+                                               max_community=11, seed=seed)
+                gml_file = path + '/graphs/lfr_hard".gml'
+            elif diff == "test":
+                G = create_lfr_benchmark_graph(n=80, tau1=6.5, tau2=1.5, mu=0.08, max_degree=20, min_community=7,
+                                               max_community=11, seed=seed)
+                gml_file = path + '/graphs/lfr_test.gml'
+            else:
+                print("No correct benchmark given!")
+
+        except nx.exception.ExceededMaxIterations:
+            pass
+
+        # rejected graphs only show up in the try counter
+        if not (G is None):
+            connected = nx.is_connected(G)
+            if not connected:
+                G = None
+
+    print(f"{str(i):10}")
+    # graphs of the same complexity are created by parallel workers, which all write this file
+    _write_gml_atomically(G, gml_file)
+
+    if cache_file is not None:
+        # rebuild the graph in the node and edge order it has when read from the cache file, so a seeded graph is
+        # the same whether it was just created or loaded
+        cached_G = nx.Graph()
+        cached_G.graph["seed"] = seed
+        cached_G.add_nodes_from(G.nodes(data=True))
+        cached_G.add_edges_from(G.edges(data=True))
+        G = cached_G
+
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        _write_gml_atomically(G, cache_file)
+
+    return _return_lfr_graph(G, seed, filename, return_seed)
+
+
+def _write_gml_atomically(G, gml_file):
+    """
+    Writes a graph to a .gml file through a temporary file of this process, so that parallel workers writing or
+    reading the same file never see a partially written one.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be written.
+    gml_file : String
+        The path of the .gml file.
+    """
+    temporary_file = gml_file + "." + str(os.getpid()) + ".tmp"
+    nx.write_gml(G, temporary_file)
+    os.replace(temporary_file, gml_file)
+
+
+def _return_lfr_graph(G, seed, filename, return_seed):
+    """
+    Saves the seed of an lfr graph in the seeds file (if given) and returns the graph the way create_lfr_graph does.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The created lfr graph.
+    seed : int
+        The seed the graph was created with.
+    filename : String
+        If a filename is given the seed will be saved in the file.
+    return_seed : bool
+        If set to True, the seed of the graph is returned as well.
+
+    Returns
+    -------
+    G : networkx.classes.graph.Graph
+        The lfr graph.
+    seed : int
+        The seed the graph was created with. Only returned if return_seed is set to True.
+    """
+    if not (filename is None):
+        with open(filename, "a") as f:
+            f.write(f"{str(seed):15}")
+
+    if return_seed:
+        return G, seed
+    return G
+
+
+def create_sbm_graph(n=400, c=10, intra_prob=0.375, seed=None):
+    inter_prob = 1 - intra_prob
+    sizes = [int(n/c)] * c  # equally sized communities
+    # edge connection probabilities for sbm, 1/2 is for nullifying double counting from symmetry of the matrix:
+    probs = np.full((c, c), 1/2 * inter_prob/(c-1))
+    np.fill_diagonal(probs, intra_prob)
+    G = nx.stochastic_block_model(sizes, probs, seed=seed)
+    return G
+
+
+def create_lfr_benchmark_graph(n=100, tau1=3, tau2=2, mu=0.05, average_degree=10, max_degree=30, min_community=20,
+                               max_community=100, seed=None, file_name=None):
+    """Creates a sample LFR benchmark graph. Saves it as a .gml file if a file_name is specified.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of nodes in the graph.
+    tau1 : float, optional
+        Power law exponent for the degree distribution of the created
+        graph. This value must be strictly greater than one.
+    tau2 : float, optional
+        Power law exponent for the community size distribution in the
+        created graph. This value must be strictly greater than one.
+    mu : float, optional
+        Fraction of inter-community edges incident to each node. This
+        value must be in the interval [0, 1].
+    average_degree : float, optional
+        Desired average degree of nodes in the created graph. This value
+        must be in the interval [0, *n*]. Exactly one of this and
+        ``min_degree`` must be specified, otherwise a
+        :exc:`NetworkXError` is raised.
+    max_degree : int, optional
+        Maximum degree of nodes in the created graph. If not specified,
+        this is set to ``n``, the total number of nodes in the graph.
+    min_community : int, optional
+        Minimum size of communities in the graph. If not specified, this
+        is set to ``min_degree``.
+    max_community : int, optional
+        Maximum size of communities in the graph. If not specified, this
+        is set to ``n``, the total number of nodes in the graph.
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+    file_name : str, optional
+        If specified, a .gml of the generated LFR benchmark graph will be saved under this file name.
+
+    Returns
+    -------
+    networkx.classes.graph.Graph
+        The LFR benchmark graph as a networkx graph object. The community structure gets encoded as a node attribute
+        under the name of "ground_truth_community".
+    """
+    from networkx.generators.community import LFR_benchmark_graph
+
+    G = LFR_benchmark_graph(n, tau1, tau2, mu, max_degree=max_degree, average_degree=average_degree,
+                            min_community=min_community, max_community=max_community, seed=seed)
+    G.remove_edges_from(nx.selfloop_edges(G))
+    # replace the community set of every node by its string in one pass over the attribute dicts of the nodes
+    for _, attributes in G.nodes(data=True):
+        attributes["ground_truth_community"] = str(attributes.pop("community"))
+    if file_name is not None:
+        nx.write_gml(G, file_name)
+    return G
+
+
+def create_random_seed(low_end=100000, high_end=999999):
+    rand_seed = _seed_rng.randint(low_end, high_end)
+    return rand_seed
+
+
+def create_seed_list(seed=694201337, amount_of_seeds=50, low_end=100000, high_end=999999):
+    random.seed(seed)
+    seeds = []
+    for i in range(amount_of_seeds):
+        seeds.append(random.randrange(low_end, high_end))
+    return seeds
+
+
+def assign_com_index_ground_truth(G):
+    """ 
+    Analyzes the ground truth of an lfr graph and assigns each node a community index.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed. Has to be an lfr graph with ground truth.
+    
+    Returns
+    -------
+    dict
+        The assignments of nodes to community indices.
+    """
+    ground_truth = nx.get_node_attributes(G, "ground_truth_community")
+    # community -> index, new communities get the next free index in order of their first appearance
+    com_to_index = {}
+    assignment_index = {}
+
+    for key in ground_truth:
+        assignment_index[key] = com_to_index.setdefault(ground_truth[key], len(com_to_index))
+
+    return assignment_index
+
+
+def count_lfr_coms(G):
+    """
+    Counts the number of communities for an lfr graph with ground truth.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed. Has to be an lfr graph with ground truth.
+    
+    Returns
+    -------
+    int
+        The number of communities in the graph.
+    """
+    ground_truth = nx.get_node_attributes(G, "ground_truth_community")
+    com_amounts = len(set(ground_truth.values()))
+    return com_amounts
+
+
+def parse_ground_truth_communities(ground_truth):
+    """
+    Parses every distinct ground truth community string exactly once.
+
+    Parameters
+    ----------
+    ground_truth : dict
+        The "ground_truth_community" node attributes of an lfr graph, each community given as the string of a set.
+
+    Returns
+    -------
+    dict
+        The parsed set of nodes for every community string, in order of the first appearance of the community.
+    """
+    import ast
+
+    return {com: ast.literal_eval(com) for com in dict.fromkeys(ground_truth.values())}
+
+
+def get_community_sets(G, attribute="ground_truth_community"):
+    """
+    Returns the ground truth communities of a graph as node sets. The result is cached for every graph, so the ground
+    truth of a graph must not change after the first call.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    attribute : str
+        Either "ground_truth_community" for lfr graphs, where every node stores the string of its community, or
+        "block" for sbm graphs, where every node stores the index of its block.
+
+    Returns
+    -------
+    list
+        The communities as frozensets of nodes.
+    """
+    cache = _community_sets_cache.setdefault(G, {})
+    if attribute not in cache:
+        values = nx.get_node_attributes(G, attribute)
+        if attribute == "ground_truth_community":
+            communities = [frozenset(com) for com in parse_ground_truth_communities(values).values()]
+        else:
+            blocks = {}
+            for node, com in values.items():
+                blocks.setdefault(com, set()).add(node)
+            communities = [frozenset(com) for com in blocks.values()]
+        cache[attribute] = communities
+    return cache[attribute]
+
+
+def assign_nodes_to_coms(G, communities):
+    """
+    Calculates the modularity of the graph g using the assignments of all
+    nodes to their community.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    communities : dict
+        All communities in the graph keyed by their index.
+    
+    Returns
+    -------
+    node_assignments : dict
+        A dictionary keyed by every node with their community index as their value
+    """
+    # invert the communities once, a node contained in several communities keeps the last one
+    node_to_com = {}
+    for j, c in communities.items():
+        for node in c:
+            node_to_com[node] = j
+
+    node_assignments = {i: node_to_com.get(i) for i in G.nodes()}
+    return node_assignments
+
+
+def get_community_csr(communities, n):
+    """
+    Converts communities into a compact CSR representation, from which community sizes, members and the community of
+    every node can be read without iterating over the dict again.
+
+    Parameters
+    ----------
+    communities : dict
+        All communities keyed by their index. The nodes have to be the integers 0, ..., n-1.
+    n : int
+        The number of nodes in the graph.
+
+    Returns
+    -------
+    indptr : np.array
+        The members of the k-th community are nodes[indptr[k]:indptr[k+1]].
+    nodes : np.array
+        The members of all communities, grouped by community.
+    com_id : np.array
+        The position of the community of every node in indptr, -1 if the node is in no community.
+    """
+    indptr = np.cumsum([0] + [len(c) for c in communities.values()])
+    nodes = np.fromiter(chain.from_iterable(communities.values()), dtype=np.int32, count=indptr[-1])
+    com_id = np.full(n, -1, dtype=np.int32)
+    com_id[nodes] = np.repeat(np.arange(len(communities), dtype=np.int32), np.diff(indptr))
+    return indptr, nodes, com_id
+
+
+def calculate_modularity(G, node_assignments):
+    """
+    Calculates the modularity of the graph g using the assignments of all
+    nodes to their community.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    node_assignments : dict
+        The community assignments of the nodes keyed by the node index.
+        Form: {node: community_assignment}
+    
+    Returns
+    -------
+    float
+        The modularity of graph g with its nodes assigned to communities as
+        described in node_assignments.
+    """
+    community_buckets = defaultdict(set)
+    for node, community_index in node_assignments.items():
+        community_buckets[community_index].add(node)
+    communities = list(community_buckets.values())
+    return nx.algorithms.community.modularity(G, communities)
+
+
+def find_separation_node_set(G, iterations=1, file_name=None):
+    """
+    Searches for a set of separator-nodes for the given input graph.
+    Returns the empty set if no such set was found.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to analyse. Has to include node attributes named "ground_truth_community" specifying the community of
+        each node via the set all nodes in that nodes community.
+    iterations : int, optional
+        Number of solutions to be fetched from the QUBO solver.
+    file_name : str, optional
+        If a suitable set of nodes was found, and a file name was specified, the resulting graph (with node attributes
+        flagging the computed separation-node set) gets stored.
+
+    Returns
+    -------
+    set
+        A set of separator-nodes. Set is empty if no adequate set was found. An adequate set is defined as a bijective
+        separator-node set.
+    """
+    n = G.number_of_nodes()
+    communities = nx.get_node_attributes(G, "ground_truth_community")
+    node_list = list(G.nodes)
+    numbering = {node_list[i]: i for i in range(len(node_list))}
+
+    # community index of every node and the numbered end points of every edge as arrays
+    com_to_index = {}
+    node_com = np.fromiter((com_to_index.setdefault(communities[v], len(com_to_index)) for v in node_list),
+                           dtype=np.int64, count=n)
+    edges = np.fromiter((numbering[v] for edge in G.edges for v in edge), dtype=np.int64,
+                        count=2 * G.number_of_edges()).reshape(-1, 2)
+
+    q = np.zeros((n, n))
+    np.fill_diagonal(q, -1)
+    q[edges[:, 0], edges[:, 1]] = np.where(node_com[edges[:, 0]] == node_com[edges[:, 1]], 0, 20)
+    # imported here, the QUBO solver stack is only needed for this search
+    import neighborhoodConnectivity
+
+    solution = neighborhoodConnectivity.solve(q, iterations)
+    # the solution is keyed by the position of the node in node_list
+    node_assignments = {node_list[index]: classification for index, classification in solution.items()}
+    identified_nodes = [v for v in node_assignments if node_assignments[v] == 0]
+
+    # check if the identified nodes actually form a set of separator-nodes.
+    identified_node_set = set(identified_nodes)
+    H = G.subgraph([v for v in G.nodes if v not in identified_node_set]).copy()
+    # the ground truth communities hold integer nodes, convert every connected component only once
+    connected_components = [{int(x) for x in cc} for cc in nx.connected_components(H)]
+
+    gt_communities = get_community_sets(G)
+    # check separation-node set property of the connected components
+    # in other words: check if each connected component is subset of exactly one ground truth community
+    # (the communities are disjoint, so the first community containing the component is the only one)
+
+    for cc in connected_components:
+        if not any(cc.issubset(com) for com in gt_communities):
+            print('The calculated set is not a set of separation-nodes!')
+            return set()
+    # check bijectivity of the corresponding refinement map
+    # in other words: check if each ground truth community is superset of exactly one connected component
+    for com in gt_communities:
+        alright = False
+        for cc in connected_components:
+            if com.issuperset(cc):
+                if not alright:
+                    alright = True
+                else:
+                    print('The calculated set is not a bijective set of separation-nodes!2')
+                    return set()
+        if not alright:
+            print('The calculated set is not a bijective set of separation-nodes!1')
+            return set()
+
+    identified_nodes = set(identified_nodes)
+    print('\nFollowing set of separator-nodes was found: ' + str(identified_nodes))
+    # set node attributes for G
+    attrs = {node: {'separation_node': (node in identified_nodes)} for node in G.nodes}
+    nx.set_node_attributes(G, attrs)
+    if file_name is not None:
+        nx.write_gml(G, file_name)
+    calculate_core_nodes(H)
+    return identified_nodes
+
+
+def calculate_core_nodes(G):
+    """
+    Calculates the set of core-nodes. (Also prints the number of core-nodes.)
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to analyse. Has to include node attributes named "ground_truth_community" specifying the community of
+        each node via the set all nodes in that nodes community.
+
+    Returns
+    -------
+    set
+        The set of core-nodes.
+    """
+    communities = nx.get_node_attributes(G, "ground_truth_community")
+    # intern the community strings, so that the comparisons along the edges are integer comparisons
+    com_to_index = {}
+    com_index = {v: com_to_index.setdefault(com, len(com_to_index)) for v, com in communities.items()}
+
+    # a core node has no neighbor outside of its own community, all() stops at the first one found
+    number_of_core_nodes = sum(1 for v, neighbors in G.adjacency()
+                               if all(com_index[w] == com_index[v] for w in neighbors))
+    print('number_of_core_nodes: ' + str(number_of_core_nodes))
+    print('number_of_border_nodes: ' + str(G.number_of_nodes() - number_of_core_nodes))
+
+
+def find_constraint_violations(G, x):
+    """
+    Finds separation node constraints in a given set of separation nodes.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    x : array_like
+        The separation node classification of every node, indexed by the node.
+        0 corresponds to a separation node, all other nodes are assigned with 1.
+    
+    Returns
+    -------
+    separation_set_constraint_violations : int
+        The amount of separation nodes set constraint violations.
+    injectivity_violations : int
+        The amount of injectivity constraint violations.
+    surjectivity_violations : int
+        The amount of surjectivity constraint violations.
+    """
+    # the violations are counted once by the tracker that simulated annealing updates incrementally, so that both
+    # always agree
+    return ConstraintViolationTracker(G, x).violations
+
+
+class ConstraintViolationTracker:
+    """
+    Counts the separation node set, injectivity and surjectivity violations of a separation node classification and
+    keeps them up to date while single nodes are flipped, by only recomputing the connected components the flipped node
+    touches. find_constraint_violations returns the violations of a single classification.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The sbm graph to be analysed, every node must store the index of its block.
+    x : array_like
+        The initial separation node classification of every node, indexed by the node.
+        0 corresponds to a separation node, all other nodes are assigned with 1.
+    """
+
+    def __init__(self, G, x):
+        self.adj = G.adj
+        self.block = nx.get_node_attributes(G, "block")
+        self.n_communities = len(get_community_sets(G, "block"))
+        self.remaining = {node for node in G.nodes() if x[node]}
+
+        # connected components of the remaining nodes with their sizes and their intersection sizes per community
+        self.components = {}
+        self.component_of = {}
+        self.component_blocks = {}
+        for k, cc in enumerate(nx.connected_components(G.subgraph(self.remaining))):
+            self.components[k] = cc
+            self.component_of.update(dict.fromkeys(cc, k))
+            self.component_blocks[k] = Counter(self.block[v] for v in cc)
+        self.next_component = len(self.components)
+
+        # for every community the sizes of all connected components intersecting it, as multiset
+        self.community_cc_sizes = defaultdict(Counter)
+        for k, blocks in self.component_blocks.items():
+            for com in blocks:
+                self.community_cc_sizes[com][len(self.components[k])] += 1
+
+        self.violations = self._violations()
+        self.pending = None
+
+    def _violations(self):
+        separation_set_constraint_violations = sum(len(self.components[k]) - max(blocks.values())
+                                                   for k, blocks in self.component_blocks.items())
+        injectivity_violations = sum(self._injectivity(sizes) for sizes in self.community_cc_sizes.values())
+        surjectivity_violations = self.n_communities - sum(1 for sizes in self.community_cc_sizes.values() if sizes)
+        return separation_set_constraint_violations, injectivity_violations, surjectivity_violations
+
+    @staticmethod
+    def _injectivity(sizes):
+        # nodes of all connected components intersecting a community besides the biggest one
+        if not sizes:
+            return 0
+        return sum(size * count for size, count in sizes.items()) - max(sizes)
+
+    def _explore(self, start, excluded, stop_nodes):
+        # nodes reachable from start within the remaining nodes besides excluded, the reached stop_nodes are removed
+        # from it and None is returned as soon as all of them are reached
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in self.adj[node]:
+                if neighbor not in seen and neighbor != excluded and neighbor in self.remaining:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+                    stop_nodes.discard(neighbor)
+                    if not stop_nodes:
+                        return None
+        return seen
+
+    def flip(self, node):
+        """
+        Computes the constraint violations after flipping the classification of node, without applying the flip.
+
+        Parameters
+        ----------
+        node : hashable
+            The node whose classification is flipped.
+
+        Returns
+        -------
+        tuple
+            The separation node set, injectivity and surjectivity violations after the flip.
+        """
+        removed = []  # ids of the connected components that disappear
+        added = []  # (size, community intersection sizes) of the connected components that appear
+        pieces = []
+        if node in self.remaining:
+            # the connected component of node falls apart into the pieces containing the remaining neighbors of node
+            k = self.component_of[node]
+            removed.append(k)
+            unreached = {neighbor for neighbor in self.adj[node] if neighbor in self.remaining and neighbor != node}
+            rest_size = len(self.components[k]) - 1
+            rest_blocks = self.component_blocks[k].copy()
+            rest_blocks[self.block[node]] -= 1
+            while unreached:
+                start = unreached.pop()
+                # the piece reaching the last unreached neighbor is whatever is left of the connected component
+                piece = self._explore(start, node, unreached) if unreached else None
+                if piece is None:
+                    break
+                # all other neighbors are unreachable from this piece, so it is a connected component of its own
+                blocks = Counter(self.block[v] for v in piece)
+                pieces.append((piece, blocks))
+                added.append((len(piece), blocks))
+                rest_size -= len(piece)
+                rest_blocks.subtract(blocks)
+            if rest_size:
+                added.append((rest_size, +rest_blocks))
+        else:
+            # node joins all connected components of its remaining neighbors
+            merged = {self.component_of[neighbor] for neighbor in self.adj[node] if neighbor in self.remaining}
+            removed.extend(merged)
+            blocks = Counter({self.block[node]: 1})
+            for k in merged:
+                blocks.update(self.component_blocks[k])
+            added.append((1 + sum(len(self.components[k]) for k in merged), blocks))
+
+        separation_set_constraint_violations, injectivity_violations, surjectivity_violations = self.violations
+        community_cc_sizes = {}
+        for k in removed:
+            size = len(self.components[k])
+            separation_set_constraint_violations -= size - max(self.component_blocks[k].values())
+            for com in self.component_blocks[k]:
+                sizes = community_cc_sizes.setdefault(com, self.community_cc_sizes[com].copy())
+                sizes[size] -= 1
+        for size, blocks in added:
+            separation_set_constraint_violations += size - max(blocks.values())
+            for com in blocks:
+                sizes = community_cc_sizes.setdefault(com, self.community_cc_sizes[com].copy())
+                sizes[size] += 1
+        for com, sizes in community_cc_sizes.items():
+            sizes = +sizes
+            community_cc_sizes[com] = sizes
+            old_sizes = self.community_cc_sizes[com]
+            injectivity_violations += self._injectivity(sizes) - self._injectivity(old_sizes)
+            surjectivity_violations += bool(old_sizes) - bool(sizes)
+
+        violations = separation_set_constraint_violations, injectivity_violations, surjectivity_violations
+        self.pending = (node, removed, pieces, community_cc_sizes, violations)
+        return violations
+
+    def accept(self):
+        """
+        Applies the flip of the last call of flip.
+
+        Returns
+        -------
+        NOTHING
+        """
+        node, removed, pieces, community_cc_sizes, violations = self.pending
+        self.pending = None
+        if node in self.remaining:
+            k = removed[0]
+            self.remaining.discard(node)
+            del self.component_of[node]
+            rest = self.components[k]
+            rest.discard(node)
+            self.component_blocks[k][self.block[node]] -= 1
+            for piece, blocks in pieces:
+                rest -= piece
+                self.component_blocks[k].subtract(blocks)
+                self.components[self.next_component] = piece
+                self.component_blocks[self.next_component] = blocks
+                self.component_of.update(dict.fromkeys(piece, self.next_component))
+                self.next_component += 1
+            if rest:
+                self.component_blocks[k] = +self.component_blocks[k]
+            else:
+                del self.components[k], self.component_blocks[k]
+        else:
+            self.remaining.add(node)
+            if removed:
+                # the smaller connected components are merged into the biggest one
+                k = max(removed, key=lambda k: len(self.components[k]))
+                for other in removed:
+                    if other != k:
+                        self.components[k] |= self.components[other]
+                        self.component_blocks[k].update(self.component_blocks[other])
+                        self.component_of.update(dict.fromkeys(self.components[other], k))
+                        del self.components[other], self.component_blocks[other]
+            else:
+                k = self.next_component
+                self.next_component += 1
+                self.components[k] = set()
+                self.component_blocks[k] = Counter()
+            self.components[k].add(node)
+            self.component_blocks[k][self.block[node]] += 1
+            self.component_of[node] = k
+        self.community_cc_sizes.update(community_cc_sizes)
+        self.violations = violations
+
+
+def get_all_separation_nodes_edges_lfr(G):
+    """
+    Gets every separation node and edge from an lfr graph with ground truth.
+
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed. Has to be an lfr graph with ground truth.
+
+    Returns
+    -------
+    separation_nodes : list
+        A list of all the separation nodes in the graph.
+    separation_edges : list
+        A list of all the separation edges in the graph.
+    """
+
+    com_index_gt = assign_com_index_ground_truth(G)
+
+    separation_nodes = []
+    separation_edges = []
+    # every separating edge is stored once, the set only keeps the node membership tests O(1)
+    found_nodes = set()
+
+    for (i, j) in G.edges:
+        if com_index_gt[i] != com_index_gt[j]:
+
+            separation_edges.append((i, j))
+
+            if i not in found_nodes:
+                found_nodes.add(i)
+                separation_nodes.append(i)
+            if j not in found_nodes:
+                found_nodes.add(j)
+                separation_nodes.append(j)
+
+    return separation_nodes, separation_edges
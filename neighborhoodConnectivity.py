@@ -1,414 +1,588 @@
-import networkx as nx
-import numpy as np
-import math
-import dimod
-import graphs
-from random import randrange
-from numpy.random import rand
-
-
-def bfs(G, v, w, d=2):
-    """Executes a breadth-first search starting a the nodes v and w and omitting the edge (v, w)
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The networkx graph containing the edge to be analysed.
-    v : hashable
-        A node in the graph G, must be adjacent to w.
-    w : hashable
-        A node in the graph G, must be adjacent to v.
-    d : int
-        The depth of the neighborhood to explore.
-    
-    Returns
-    -------
-    node_layer_depth : dict
-        Dict mapping each node to its layer depth, -1 if node was not explored.
-    nodes_in_layers : dict
-        Dict mapping each layer to all nodes contained in that layer, keyed by the layer's depth.
-        d(v) = d(w) = 0
-    edge_layer_depth : dict
-        Dict mapping each edge to its layer depth, -1 if edge was not explored.
-        The edge layer depth of an edge d(v, w) is the average of the node layer depths (d(v)+d(w))/2.
-    edges_in_layers : dict
-        Dict mapping each layer depth to all edges contained in that layer.
-    sub_tree_root : dict
-        Dict mapping each node to its respective subtree root(s), None if node was not explored.
-        The possible subtree roots are v and w and {v,w} if the respective node has parents of different subtree roots.
-    """
-    # delete and later reintroduce the edge between v & w
-    G.remove_edge(v, w)
-
-    edge_layer_depth = {edge: -1 for edge in G.edges()}
-    edge_layer_depth[(v, w)] = 0
-    edge_layer_depth[(w, v)] = 0
-
-    sub_tree_root = {node: None for node in G.nodes()}
-    sub_tree_root[v] = v
-    sub_tree_root[w] = w
-
-    node_layer_depth = {node: -1 for node in G.nodes()}
-    node_layer_depth[v] = 0
-    node_layer_depth[w] = 0
-
-    nodes_in_layers = {i: set() for i in range(d + 1)}
-    nodes_in_layers[0] = {v, w}
-
-    edges_in_layers = {i: set() for i in np.arange(0.5, d, 0.5)}
-
-    for i in range(0, d):
-        for node in nodes_in_layers[i]:
-            for neighbor in G.neighbors(node):  # typical bfs iterations
-                if node_layer_depth[neighbor] == -1:  # previously unseen
-                    nodes_in_layers[i+1].add(neighbor)
-                    node_layer_depth[neighbor] = i + 1
-                    edges_in_layers[i+0.5].add((node, neighbor))
-                    edge_layer_depth[(node, neighbor)] = i + 0.5
-                    edge_layer_depth[(neighbor, node)] = i + 0.5
-                    sub_tree_root[neighbor] = sub_tree_root[node]
-                # neighbor is in same layer as node, and has already been explored
-                elif node_layer_depth[neighbor] == node_layer_depth[node]:
-                    # make sure the edge wasn't considered before from the opposite direction
-                    if (neighbor, node) not in edges_in_layers[i]:
-                        edges_in_layers[i].add((node, neighbor))
-                        edge_layer_depth[(node, neighbor)] = i
-                        edge_layer_depth[(neighbor, node)] = i
-                # neighbor is in layer below node, and has already been explored
-                elif node_layer_depth[neighbor] == node_layer_depth[node] + 1:
-                    edges_in_layers[i+0.5].add((node, neighbor))
-                    edge_layer_depth[(node, neighbor)] = i + 0.5
-                    edge_layer_depth[(neighbor, node)] = i + 0.5
-                    # if new parental subroot appears, mark as an intersection node
-                    if sub_tree_root[neighbor] != sub_tree_root[node]:
-                        sub_tree_root[neighbor] = {v, w}
-
-    G.add_edge(v, w)
-
-    return node_layer_depth, nodes_in_layers, edges_in_layers, edge_layer_depth, sub_tree_root
-
-
-def neighborhood_connectivity(G, v, w, edges_in_layers, sub_tree_root, nodes_in_layers, a=0.5):
-    """Executes a breadth-first search starting a the nodes v and w and omitting the edge (v, w)
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The networkx graph containing the edge to be analysed.
-    v : hashable
-        A node in the graph G, must be adjacent to w.
-    w : hashable
-        A node in the graph G, must be adjacent to v.
-    edges_in_layers : dict
-        Dict mapping each layer depth to all edges contained in that layer.
-    sub_tree_root : dict
-        Dict mapping each node to its respective subtree root(s), None if node was not explored.
-        The possible subtree roots are v and w and {v,w} if the respective node has parents of different subtree roots.
-    a : number
-        Determines the influence of direct 2-path connections between v and w vs the influence of 3-path connections
-        between v and w. a = 1 only values 2-path connections and a = 0 only values 3-path connections.
-    nodes_in_layers : dict
-    
-    Returns
-    -------
-    edge_nc : dict
-        Dict mapping each edge to its layer depth, -1 if edge is not relevant for the nc computation.
-        The edge layer depth of an edge d(v, w) is the average of the node layer depths (d(v)+d(w))/2.
-        This variable is only relevant for plotting the respectively used edges for nc computation.
-    nc : number
-        The neighborhood connectivity between v and w approximating \delta_{c(v)c(w)}.
-    """
-    d = len(edges_in_layers)
-
-    nc_edges = {k: set() for k in np.arange(0.5, math.ceil(d/2), 0.5)}
-    edge_nc = {(i, j): -1 for (i, j) in G.edges()}
-    edge_nc[(v, w)] = 0
-    edge_nc[(w, v)] = 0
-
-    for k in np.arange(0.5, math.ceil(d/2), 0.5):  # iterate over all previously explored edges
-        for (i, j) in edges_in_layers[k]:
-            if k == int(k):
-                if sub_tree_root[i] != sub_tree_root[j] or sub_tree_root[i] == {v, w}:
-                    nc_edges[k].add((i, j))
-                    edge_nc[(i, j)] = k
-                    edge_nc[(j, i)] = k
-            else:
-                if sub_tree_root[i] == {v, w} or sub_tree_root[j] == {v, w}:
-                    nc_edges[k].add((i, j))
-                    edge_nc[(i, j)] = k
-                    edge_nc[(j, i)] = k
-
-    # calculate neighborhood connectivity while circumventing possible divisions by zero
-    def fun(x, y): return x * y / (2*G.number_of_edges())
-
-    free_stubs_v = {i: sum([getattr(G, 'degree')[node] -
-                            sum([1 for (a, b) in edges_in_layers[i-0.5] if a == node or b == node])
-                            for node in nodes_in_layers[i] if sub_tree_root[node] == v]) for i in range(1, d)}
-    free_stubs_v[0] = getattr(G, 'degree')[v] - 1
-    free_stubs_w = {i: sum([getattr(G, 'degree')[node] -
-                            sum([1 for (a, b) in edges_in_layers[i-0.5] if a == node or b == node])
-                            for node in nodes_in_layers[i] if sub_tree_root[node] == w]) for i in range(1, d)}
-    free_stubs_w[0] = getattr(G, 'degree')[w] - 1
-    free_stubs_intersection = {i: sum([getattr(G, 'degree')[node] -
-                                       sum([1 for (a, b) in edges_in_layers[i-0.5] if a == node or b == node])
-                                       for node in nodes_in_layers[i] if sub_tree_root[node] == {v, w}])
-                               for i in range(1, d)}
-    free_stubs_intersection[0] = 0
-    estimated_connections = {k: fun(free_stubs_v[k], free_stubs_w[k]) + fun(free_stubs_intersection[k], free_stubs_v[k]
-                                                                            + free_stubs_w[k] + free_stubs_intersection[k]) if k == int(k) else fun(free_stubs_v[k-0.5] + free_stubs_w[k-0.5] + free_stubs_intersection[k-0.5], sum([getattr(G, 'degree')[node] for node in nodes_in_layers[k+0.5]])) for k in np.arange(0.5, math.ceil(d/2), 0.5)}
-
-    nc = 0
-    if d > 1 and len(edges_in_layers[1]) != 0:
-        nc = a * (len(nc_edges[0.5]) - estimated_connections[0.5]) / len(edges_in_layers[0.5]) + \
-             (1 - a) * (len(nc_edges[1]) - estimated_connections[1]) / len(edges_in_layers[1])
-    elif len(edges_in_layers[0.5]) != 0:
-        nc = (len(nc_edges[0.5]) - estimated_connections[0.5]) / len(edges_in_layers[0.5])
-    nc = (nc+1)/2
-    return edge_nc, nc
-
-
-def solve(q, iterations=1):
-    """
-    Uses Simulated Annealing to find a best possible solution to the passed qubo q.
-    
-    Parameters
-    ----------
-    q : np.array
-        The qubo matrix, a 2d-np.array.
-    iterations : int
-        The number of times the QUBO should get solved using SA.
-    
-    Returns
-    -------
-    dict
-        The qubit indices and their assigned values of the best solution found for all iterations.
-    """
-    sampleset = dimod.SimulatedAnnealingSampler().sample_qubo(q, num_reads=iterations)
-    solution = (sampleset.samples())[0]
-
-    return {key: value for (key, value) in solution.items()}
-
-
-def calculate_qubo_nc(G, estimations):
-    """Calculates the QUBO matrix for finding an optimal set of separation nodes based on a given separation
-    edge estimation.
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed.
-    estimations : dict
-        A dict with the separation edge estimations, form: {(v, w): nc_estimation}.
-    Returns
-    -------
-    np.array
-        The corresponding QUBO matrix Q.
-    """
-    n = G.number_of_nodes()
-    Q = np.zeros((n, n))
-
-    for i in G.nodes():
-        Q[i][i] = -1
-
-    for (i, j) in estimations:
-        Q[i][j] = 2 * (1 - estimations[(i, j)])
-
-    return Q
-
-
-def run_separation_node_classification(G, d=2, a=0.5, iterations=20, draw=True):
-    """Calculates the QUBO matrix for finding an optimal set of separation nodes based on a given separation edge
-    estimation. Uses neighborhood centrality as the hard coded method of separation edge estimation.
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed.
-    d : int
-        The depth until which the breadth-first search of the neighborhood connectivity should be executed.
-        Currently does not change anything about the result for d > 2 (and does not work for d > 2).
-    a :
-        Determines the influence of direct 2-path connections between v and w vs the influence of 3-path connections
-        between v and w. a = 1 only values 2-path connections and a = 0 only values 3-path connections.
-    iterations : int
-        The number of times the QUBO should get solved using the solver specified below (currently Simulated Annealing).
-    draw : bool
-        If set to True, the result is drawn.
-    
-    Returns
-    -------
-    dict
-        The separation node classification of every node.
-        0 corresponds to a separation node, all other nodes are assigned with 1.
-    """
-    estimations = dict()
-
-    for (i, j) in G.edges():
-        node_layer_depth, nodes_in_layers, edges_in_layers, edge_layer_depth, sub_tree_root = bfs(G, i, j, d)
-        edge_nc, nc = neighborhood_connectivity(G, i, j, edges_in_layers, sub_tree_root, nodes_in_layers, a=a)
-        estimations[(i, j)] = nc
-
-    Q = calculate_qubo_nc(G, estimations)
-    solution = solve(Q, iterations=iterations)
-
-    if draw:
-        node_color = []
-        def map_to_colors(x): return 'r' if x == 0 else 'b'
-
-        for i in G.nodes():
-            node_color.append(map_to_colors(solution[i]))
-
-        nx.draw(G, node_color=node_color, with_labels=True)
-
-    return solution
-
-
-def greedy_separation_node_classification(H, classification):
-    """
-    Greedy approach to determine communities through separation nodes.
-    
-    Parameters
-    ----------
-    H : networkx.classes.graph.Graph
-        The graph to be analysed.
-    classification : dict 
-        The separation node classification of every node.
-        0 corresponds to a separation node, all other nodes are assigned with 1.    
-    
-    Returns
-    -------
-    communities : dict
-        All found communities keyed by their index.
-    """
-    # H is the original graph
-    # G is the subgraph formed by all non-separation nodes (later excluding isolated nodes)
-    G = nx.induced_subgraph(H, [i for i in H.nodes() if classification[i] == 1]).copy()
-
-    isolated_nodes = [i for i in G.nodes() if G.degree[i] == 0]
-
-    G.remove_nodes_from(isolated_nodes)
-    for i in isolated_nodes:
-        classification[i] = 0
-
-    separation_node_set = [i for i in H.nodes() if classification[i] == 0]
-
-    initial_separation_node_set = separation_node_set.copy()
-
-    communities = {i: set(c) for i, c in enumerate(nx.connected_components(G))}
-
-    most_certain_node_connectedness = -1
-    most_certain_node = 0
-    most_certain_community = 0
-
-    connection_summary = {i: {j: 0 for j in range(len(communities))} for i in separation_node_set}
-
-    for i in separation_node_set:
-        for j in H.neighbors(i):
-            for k, c in communities.items():
-                if j in c:
-                    connection_summary[i][k] += 1
-                    if connection_summary[i][k] > most_certain_node_connectedness:
-                        most_certain_node_connectedness = connection_summary[i][k]
-                        most_certain_node = i
-                        most_certain_community = k
-
-    for a in range(len(initial_separation_node_set)):
-        communities[most_certain_community].add(most_certain_node)
-        separation_node_set.remove(most_certain_node)
-        most_certain_node_connectedness = -1
-
-        for i in separation_node_set:
-            for j in H.neighbors(i):
-                for k, c in communities.items():
-                    if j in c:
-                        connection_summary[i][k] += 1
-                        if connection_summary[i][k] > most_certain_node_connectedness:
-                            most_certain_node_connectedness = connection_summary[i][k]
-                            most_certain_node = i
-                            most_certain_community = k
-
-    return communities
-
-
-def simulated_annealing(G, warmstart, n_iterations, temp):
-    """
-    Simulated annealing approach using background knowledge.
-    
-    Parameters
-    ----------
-    G : networkx.classes.graph.Graph
-        The graph to be analysed.
-    warmstart :
-        Bitstring representing an initial solution
-    n_iterations : int
-        The amount of simulated annealing iterations.
-    temp : int
-        Starting temperature.
-    
-    Returns
-    -------
-    best found results throughout all runs.
-    """
-
-    n = G.number_of_nodes()
-
-    Q = np.zeros((n, n))
-    np.fill_diagonal(Q, -1)
-    for (i, j) in G.edges():
-        if G.nodes[i]["block"] != G.nodes[j]["block"]:
-            Q[i][j] = 2
-
-    def f(solution): return solution @ Q @ solution
-    # generate an initial point
-    if warmstart is None:
-        x = np.zeros(n, dtype=np.bool8)
-    else:
-        x = warmstart
-    # init best solution found so far
-    curr, curr_eval = x, f(x)
-    curr_sep_set_viols, curr_inj_viols, curr_sur_viols = graphs.find_constraint_violations(G, list(x))
-
-    best, best_eval = curr, curr_eval
-    best_sep_set_viols, best_inj_viols, best_sur_viols = curr_sep_set_viols, curr_inj_viols, curr_sur_viols
-
-    for i in range(n_iterations):
-        print('curr_eval: ' + str(curr_eval) + '\t curr_sep_set_viols: ' + str(curr_sep_set_viols) +
-              '\t curr_sur_viols: ' + str(curr_sur_viols) + '\t curr_inj_viols: ' + str(curr_inj_viols), end='\r')
-        candidate = np.copy(curr)
-        bit_flip_index = randrange(n)
-        candidate[bit_flip_index] = not curr[bit_flip_index]
-        # check if constraints are satisfied
-        cand_sep_set_viols, cand_inj_viols, cand_sur_viols = graphs.find_constraint_violations(G, list(candidate))
-        # evaluate candidate point
-        candidate_eval = f(candidate)
-        if candidate_eval <= best_eval and cand_sep_set_viols <= best_sep_set_viols and \
-           cand_sur_viols <= best_sur_viols and cand_inj_viols <= best_inj_viols:
-            best, best_eval, best_sep_set_viols, best_sur_viols, best_inj_viols = candidate, candidate_eval, \
-                                                                                  cand_sep_set_viols, cand_sur_viols, \
-                                                                                  cand_inj_viols
-            # print('>%d f(x) = %.5f' % (i, best_eval))
-            print('best_eval: ' + str(best_eval) + '\t best_sep_set_viols: ' + str(best_sep_set_viols) +
-                  '\t best_sur_viols: ' + str(best_sur_viols) + '\t best_inj_viols: ' + str(best_inj_viols), end='\r')
-        diff = candidate_eval - curr_eval
-        # calculate temperature for current epoch
-        t = temp / float(i + 1)
-        # calculate metropolis acceptance criterion
-        metropolis_eval = math.exp(-diff / t)
-        constraints_diff = (cand_sep_set_viols + cand_sur_viols + cand_inj_viols) - (curr_sep_set_viols + curr_inj_viols
-                                                                                     + curr_sur_viols)
-
-        # check if we should keep the new point
-        if constraints_diff <= 0:
-            if diff <= 0 or rand() < metropolis_eval:
-                curr, curr_eval, curr_sep_set_viols, curr_inj_viols, curr_sur_viols = candidate, candidate_eval, \
-                                                                                      cand_sep_set_viols, \
-                                                                                      cand_inj_viols, cand_sur_viols
-        """
-        # metropolis_constraints = math.exp(-constraints_diff / t)
-        else:
-            if rand() < metropolis_constraints and cand_sep_set_viols <= curr_sep_set_viols:  # dice roll is required 
-            to not care about bijectivity
-                if diff <= 0 or rand() < metropolis_eval:
-                    curr, curr_eval, curr_sep_set_viols, curr_inj_viols, curr_sur_viols = candidate, candidate_eval, 
-                    cand_sep_set_viols, cand_inj_viols, cand_sur_viols"""
-    return best, best_eval, best_sep_set_viols, best_sur_viols, best_inj_viols
+import networkx as nx
+import numpy as np
+import math
+from collections import Counter
+from itertools import chain
+import dimod
+from scipy import sparse
+import graphs
+from random import randrange
+from numpy.random import rand
+
+
+# number of simulated annealing iterations between two progress prints
+_PROGRESS_INTERVAL = 1024
+
+
+class _ExploredDict(dict):
+    """Dict of the explored nodes or edges of a bfs, returning a default value for all unexplored keys."""
+
+    def __init__(self, default):
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+
+def bfs(G, v, w, d=2):
+    """Executes a breadth-first search starting a the nodes v and w and omitting the edge (v, w)
+    The graph is only read, so bfs can be run for several edges of the same graph at once.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The networkx graph containing the edge to be analysed.
+    v : hashable
+        A node in the graph G, must be adjacent to w.
+    w : hashable
+        A node in the graph G, must be adjacent to v.
+    d : int
+        The depth of the neighborhood to explore.
+    
+    Returns
+    -------
+    node_layer_depth : dict
+        Dict mapping each node to its layer depth, -1 if node was not explored.
+    nodes_in_layers : dict
+        Dict mapping each layer to all nodes contained in that layer, keyed by the layer's depth.
+        d(v) = d(w) = 0
+    edge_layer_depth : dict
+        Dict mapping each edge to its layer depth, -1 if edge was not explored.
+        The edge layer depth of an edge d(v, w) is the average of the node layer depths (d(v)+d(w))/2.
+    edges_in_layers : dict
+        Dict mapping twice each layer depth to all edges contained in that layer, e.g. the edges between the layers 0
+        and 1 of depth 0.5 are keyed by 1.
+    sub_tree_root : dict
+        Dict mapping each node to its respective subtree root(s), None if node was not explored.
+        The possible subtree roots are v and w and {v,w} if the respective node has parents of different subtree roots.
+    """
+    # only explored nodes and edges are stored, unexplored ones fall back to the documented defaults on lookup,
+    # so a call costs O(explored neighborhood) instead of O(|V| + |E|)
+    edge_layer_depth = _ExploredDict(-1)
+    edge_layer_depth[(v, w)] = 0
+    edge_layer_depth[(w, v)] = 0
+
+    sub_tree_root = _ExploredDict(None)
+    sub_tree_root[v] = v
+    sub_tree_root[w] = w
+
+    node_layer_depth = _ExploredDict(-1)
+    node_layer_depth[v] = 0
+    node_layer_depth[w] = 0
+
+    nodes_in_layers = {i: set() for i in range(d + 1)}
+    nodes_in_layers[0] = {v, w}
+
+    edges_in_layers = {k2: set() for k2 in range(1, 2 * d)}
+
+    adj = G.adj
+    for i in range(0, d):
+        scanned = set()  # nodes of the current layer whose neighbors have been iterated already
+        for node in nodes_in_layers[i]:
+            node_depth = node_layer_depth[node]
+            # the edge (v, w) is omitted inline instead of removing it from G
+            omitted = w if node == v else v if node == w else None
+            for neighbor in adj[node]:  # typical bfs iterations
+                if neighbor == omitted:
+                    continue
+                neighbor_depth = node_layer_depth[neighbor]
+                if neighbor_depth == -1:  # previously unseen
+                    nodes_in_layers[i+1].add(neighbor)
+                    node_layer_depth[neighbor] = i + 1
+                    edges_in_layers[2*i+1].add((node, neighbor))
+                    edge_layer_depth[(node, neighbor)] = i + 0.5
+                    edge_layer_depth[(neighbor, node)] = i + 0.5
+                    sub_tree_root[neighbor] = sub_tree_root[node]
+                # neighbor is in same layer as node, and has already been explored
+                elif neighbor_depth == node_depth:
+                    # make sure the edge wasn't considered before from the opposite direction
+                    if neighbor not in scanned:
+                        edges_in_layers[2*i].add((node, neighbor))
+                        edge_layer_depth[(node, neighbor)] = i
+                        edge_layer_depth[(neighbor, node)] = i
+                # neighbor is in layer below node, and has already been explored
+                elif neighbor_depth == node_depth + 1:
+                    edges_in_layers[2*i+1].add((node, neighbor))
+                    edge_layer_depth[(node, neighbor)] = i + 0.5
+                    edge_layer_depth[(neighbor, node)] = i + 0.5
+                    # if new parental subroot appears, mark as an intersection node
+                    if sub_tree_root[neighbor] != sub_tree_root[node]:
+                        sub_tree_root[neighbor] = {v, w}
+            scanned.add(node)
+
+    return node_layer_depth, nodes_in_layers, edges_in_layers, edge_layer_depth, sub_tree_root
+
+
+def two_hop_neighborhood(neighbors, v, w):
+    """Derives the layers of a breadth-first search of depth 2 starting at the nodes v and w and omitting the edge
+    (v, w) from precomputed neighborhoods, equivalent to the corresponding outputs of bfs(G, v, w, d=2).
+    
+    Parameters
+    ----------
+    neighbors : dict
+        Dict mapping each node of the graph to the frozenset of its neighbors.
+    v : hashable
+        A node in the graph, must be adjacent to w.
+    w : hashable
+        A node in the graph, must be adjacent to v.
+    
+    Returns
+    -------
+    nodes_in_layers : dict
+        Dict mapping each layer to all nodes contained in that layer, keyed by the layer's depth.
+    edges_in_layers : dict
+        Dict mapping twice each layer depth to all edges contained in that layer, e.g. the edges between the layers 0
+        and 1 of depth 0.5 are keyed by 1.
+    sub_tree_root : dict
+        Dict mapping each explored node to its respective subtree root(s).
+    """
+    layer0 = {v, w}
+    layer1_v = neighbors[v] - layer0
+    layer1_w = neighbors[w] - layer0
+    layer1 = layer1_v | layer1_w
+    explored = layer0 | layer1
+
+    sub_tree_root = {v: v, w: w}
+    sub_tree_root.update(dict.fromkeys(layer1_v - layer1_w, v))
+    sub_tree_root.update(dict.fromkeys(layer1_w - layer1_v, w))
+    for node in layer1_v & layer1_w:
+        sub_tree_root[node] = {v, w}
+
+    edges_in_layers = {1: {(v, node) for node in layer1_v} | {(w, node) for node in layer1_w}, 2: set(), 3: set()}
+    layer2 = set()
+    unscanned = set(layer1)
+    for node in layer1:
+        unscanned.discard(node)
+        root = sub_tree_root[node]
+        # edges to already scanned layer nodes were added from the opposite direction
+        for neighbor in neighbors[node] & unscanned:
+            edges_in_layers[2].add((node, neighbor))
+        for neighbor in neighbors[node] - explored:
+            edges_in_layers[3].add((node, neighbor))
+            # nodes with parents of different subtree roots are intersection nodes
+            if neighbor not in layer2:
+                layer2.add(neighbor)
+                sub_tree_root[neighbor] = root
+            elif sub_tree_root[neighbor] != root:
+                sub_tree_root[neighbor] = {v, w}
+
+    nodes_in_layers = {0: layer0, 1: layer1, 2: layer2}
+    return nodes_in_layers, edges_in_layers, sub_tree_root
+
+
+def neighborhood_connectivity(G, v, w, edges_in_layers, sub_tree_root, nodes_in_layers, a=0.5):
+    """Executes a breadth-first search starting a the nodes v and w and omitting the edge (v, w)
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The networkx graph containing the edge to be analysed.
+    v : hashable
+        A node in the graph G, must be adjacent to w.
+    w : hashable
+        A node in the graph G, must be adjacent to v.
+    edges_in_layers : dict
+        Dict mapping twice each layer depth to all edges contained in that layer, e.g. the edges between the layers 0
+        and 1 of depth 0.5 are keyed by 1.
+    sub_tree_root : dict
+        Dict mapping each node to its respective subtree root(s), None if node was not explored.
+        The possible subtree roots are v and w and {v,w} if the respective node has parents of different subtree roots.
+    a : number
+        Determines the influence of direct 2-path connections between v and w vs the influence of 3-path connections
+        between v and w. a = 1 only values 2-path connections and a = 0 only values 3-path connections.
+    nodes_in_layers : dict
+    
+    Returns
+    -------
+    edge_nc : dict
+        Dict mapping each edge to its layer depth, -1 if edge is not relevant for the nc computation.
+        The edge layer depth of an edge d(v, w) is the average of the node layer depths (d(v)+d(w))/2.
+        This variable is only relevant for plotting the respectively used edges for nc computation.
+    nc : number
+        The neighborhood connectivity between v and w approximating \delta_{c(v)c(w)}.
+    """
+    d = len(edges_in_layers)
+    deg = G.degree
+    m2 = 2 * G.number_of_edges()
+
+    # the half-layers 0.5, 1, 1.5, ... that are analysed are indexed by twice their depth, like edges_in_layers
+    half_layers = range(1, 2 * math.ceil(d/2))
+    nc_edges = [0] * (2 * math.ceil(d/2))  # number of nc edges per doubled layer depth
+    edge_nc = _ExploredDict(-1)
+    edge_nc[(v, w)] = 0
+    edge_nc[(w, v)] = 0
+
+    # encode the subtree roots v, w and {v, w} of all explored nodes as 0, 1 and 2 for plain integer comparisons
+    root_tag = {}
+    for nodes in nodes_in_layers.values():
+        for node in nodes:
+            root = sub_tree_root[node]
+            root_tag[node] = 0 if root == v else 1 if root == w else 2
+
+    for k2 in half_layers:  # iterate over all previously explored edges
+        depth = k2 / 2  # edge_nc returns the layer depth itself
+        for (i, j) in edges_in_layers[k2]:
+            if k2 % 2 == 0:
+                if root_tag[i] != root_tag[j] or root_tag[i] == 2:
+                    nc_edges[k2] += 1
+                    edge_nc[(i, j)] = depth
+                    edge_nc[(j, i)] = depth
+            else:
+                if root_tag[i] == 2 or root_tag[j] == 2:
+                    nc_edges[k2] += 1
+                    edge_nc[(i, j)] = depth
+                    edge_nc[(j, i)] = depth
+
+    # calculate neighborhood connectivity while circumventing possible divisions by zero
+    def fun(x, y): return x * y / m2
+
+    free_stubs_v = {0: deg[v] - 1}
+    free_stubs_w = {0: deg[w] - 1}
+    free_stubs_intersection = {0: 0}
+    for i in range(1, d):
+        # the edges between two layers are counted once per incident node instead of being rescanned for every node
+        parental_edges = Counter(chain.from_iterable(edges_in_layers[2*i-1]))
+        free_stubs = [0, 0, 0]  # subtree roots v, w and {v, w}
+        for node in nodes_in_layers[i]:
+            free_stubs[root_tag[node]] += deg[node] - parental_edges[node]
+        free_stubs_v[i], free_stubs_w[i], free_stubs_intersection[i] = free_stubs
+    estimated_connections = [0] * len(nc_edges)  # indexed by twice the layer depth as well
+    for k2 in half_layers:
+        i = k2 // 2
+        if k2 % 2 == 0:
+            estimated_connections[k2] = fun(free_stubs_v[i], free_stubs_w[i]) + \
+                fun(free_stubs_intersection[i], free_stubs_v[i] + free_stubs_w[i] + free_stubs_intersection[i])
+        else:
+            # the free stubs of the layer above may connect to any stub of the layer below
+            free_stubs = free_stubs_v[i] + free_stubs_w[i] + free_stubs_intersection[i]
+            estimated_connections[k2] = fun(free_stubs, sum(deg[node] for node in nodes_in_layers[i+1]))
+
+    nc = 0
+    if d > 1 and len(edges_in_layers[2]) != 0:
+        nc = a * (nc_edges[1] - estimated_connections[1]) / len(edges_in_layers[1]) + \
+             (1 - a) * (nc_edges[2] - estimated_connections[2]) / len(edges_in_layers[2])
+    elif len(edges_in_layers[1]) != 0:
+        nc = (nc_edges[1] - estimated_connections[1]) / len(edges_in_layers[1])
+    nc = (nc+1)/2
+    return edge_nc, nc
+
+
+def solve(q, iterations=1):
+    """
+    Uses Simulated Annealing to find a best possible solution to the passed qubo q.
+    
+    Parameters
+    ----------
+    q : np.array
+        The qubo matrix, a 2d-np.array.
+    iterations : int
+        The number of times the QUBO should get solved using SA.
+    
+    Returns
+    -------
+    dict
+        The qubit indices and their assigned values of the best solution found for all iterations.
+    """
+    sampleset = dimod.SimulatedAnnealingSampler().sample_qubo(q, num_reads=iterations)
+    solution = (sampleset.samples())[0]
+
+    return {key: value for (key, value) in solution.items()}
+
+
+def calculate_qubo_nc(G, estimations):
+    """Calculates the QUBO matrix for finding an optimal set of separation nodes based on a given separation
+    edge estimation.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    estimations : dict
+        A dict with the separation edge estimations, form: {(v, w): nc_estimation}.
+    Returns
+    -------
+    np.array
+        The corresponding QUBO matrix Q.
+    """
+    n = G.number_of_nodes()
+    Q = np.zeros((n, n))
+    np.fill_diagonal(Q, -1)
+
+    # scatter all edge entries at once
+    edges = np.fromiter(chain.from_iterable(estimations), dtype=np.intp, count=2 * len(estimations)).reshape(-1, 2)
+    values = np.fromiter(estimations.values(), dtype=np.float64, count=len(estimations))
+    Q[edges[:, 0], edges[:, 1]] = 2 * (1 - values)
+
+    return Q
+
+
+def estimate_separation_edges(G, edges, d=2, a=0.5):
+    """Estimates for every given edge whether it connects two communities by its neighborhood connectivity.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph containing the edges.
+    edges : list
+        The edges to be estimated.
+    d : int
+        The depth until which the breadth-first search of the neighborhood connectivity should be executed.
+    a : number
+        Determines the influence of direct 2-path connections between v and w vs the influence of 3-path connections
+        between v and w.
+    
+    Returns
+    -------
+    estimations : dict
+        Dict mapping each edge to its neighborhood connectivity.
+    """
+    estimations = dict()
+    # the neighborhoods are shared by all edges, so the layers of depth 2 are derived from them without a bfs per edge
+    neighbors = {node: frozenset(adjacent) for node, adjacent in G.adj.items()}
+
+    for (i, j) in edges:
+        if d == 2:
+            nodes_in_layers, edges_in_layers, sub_tree_root = two_hop_neighborhood(neighbors, i, j)
+        else:
+            node_layer_depth, nodes_in_layers, edges_in_layers, edge_layer_depth, sub_tree_root = bfs(G, i, j, d)
+        edge_nc, nc = neighborhood_connectivity(G, i, j, edges_in_layers, sub_tree_root, nodes_in_layers, a=a)
+        estimations[(i, j)] = nc
+
+    return estimations
+
+
+def run_separation_node_classification(G, d=2, a=0.5, iterations=20, draw=True):
+    """Calculates the QUBO matrix for finding an optimal set of separation nodes based on a given separation edge
+    estimation. Uses neighborhood centrality as the hard coded method of separation edge estimation.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    d : int
+        The depth until which the breadth-first search of the neighborhood connectivity should be executed.
+        Currently does not change anything about the result for d > 2 (and does not work for d > 2).
+    a :
+        Determines the influence of direct 2-path connections between v and w vs the influence of 3-path connections
+        between v and w. a = 1 only values 2-path connections and a = 0 only values 3-path connections.
+    iterations : int
+        The number of times the QUBO should get solved using the solver specified below (currently Simulated Annealing).
+    draw : bool
+        If set to True, the result is drawn.
+    
+    Returns
+    -------
+    dict
+        The separation node classification of every node.
+        0 corresponds to a separation node, all other nodes are assigned with 1.
+    """
+    estimations = estimate_separation_edges(G, G.edges(), d=d, a=a)
+
+    Q = calculate_qubo_nc(G, estimations)
+    solution = solve(Q, iterations=iterations)
+
+    if draw:
+        node_color = []
+        def map_to_colors(x): return 'r' if x == 0 else 'b'
+
+        for i in G.nodes():
+            node_color.append(map_to_colors(solution[i]))
+
+        nx.draw(G, node_color=node_color, with_labels=True)
+
+    return solution
+
+
+def greedy_separation_node_classification(H, classification):
+    """
+    Greedy approach to determine communities through separation nodes.
+    
+    Parameters
+    ----------
+    H : networkx.classes.graph.Graph
+        The graph to be analysed.
+    classification : dict 
+        The separation node classification of every node.
+        0 corresponds to a separation node, all other nodes are assigned with 1.    
+    
+    Returns
+    -------
+    communities : dict
+        All found communities keyed by their index.
+    """
+    # H is the original graph
+    # G is the read-only subgraph view formed by all non-separation nodes, its isolated nodes are exactly its connected
+    # components of size one, they become separation nodes and the remaining components the initial communities
+    G = nx.induced_subgraph(H, [i for i in H.nodes() if classification[i] == 1])
+
+    connected_components = []
+    for c in nx.connected_components(G):
+        if len(c) == 1:
+            classification[next(iter(c))] = 0
+        else:
+            connected_components.append(c)
+
+    separation_node_set = [i for i in H.nodes() if classification[i] == 0]
+
+    initial_separation_node_set = separation_node_set.copy()
+
+    communities = {i: c for i, c in enumerate(connected_components)}
+
+    most_certain_node = 0
+    most_certain_community = 0
+
+    # every round adds the current number of neighbors of each remaining separation node in each community to its
+    # connection summary, these neighbor counts only change around the node that joined a community, so they are
+    # updated there and the summaries of all nodes are advanced at once
+    row = {i: r for r, i in enumerate(separation_node_set)}
+    remaining = np.ones(len(separation_node_set), dtype=bool)
+    neighbor_count = np.zeros((len(separation_node_set), len(communities)), dtype=np.int64)
+    connection_summary = np.zeros_like(neighbor_count)
+    # position of the last neighbor in each community within the adjacency of a separation node, scanning the
+    # adjacency in order, the connection summary of a community reaches its value of the round at that neighbor
+    last_neighbor = np.zeros_like(neighbor_count)
+    # the communities are disjoint, so every node is looked up directly instead of scanning all communities
+    node_to_community = {node: k for k, c in communities.items() for node in c}
+    adj = H.adj
+    neighbor_position = {}
+
+    for i in separation_node_set:
+        neighbor_position[i] = {j: position for position, j in enumerate(adj[i])}
+        for j, position in neighbor_position[i].items():
+            k = node_to_community.get(j)
+            if k is not None:
+                neighbor_count[row[i], k] += 1
+                last_neighbor[row[i], k] = position
+
+    for a in range(len(initial_separation_node_set) + 1):
+        if a > 0:
+            communities[most_certain_community].add(most_certain_node)
+            node_to_community[most_certain_node] = most_certain_community
+            separation_node_set.remove(most_certain_node)
+            remaining[row[most_certain_node]] = False
+            for j in adj[most_certain_node]:
+                if j in row and remaining[row[j]]:
+                    neighbor_count[row[j], most_certain_community] += 1
+                    last_neighbor[row[j], most_certain_community] = max(
+                        last_neighbor[row[j], most_certain_community], neighbor_position[j][most_certain_node])
+            if a == len(initial_separation_node_set):
+                break
+
+        connection_summary += neighbor_count
+        # only summaries that grew in this round compete, the most connected node first in the order of the separation
+        # node set wins and breaks ties between its communities by the position of their last neighbor
+        candidates = np.where(remaining[:, None] & (neighbor_count > 0), connection_summary, -1)
+        most_certain_node_connectedness = candidates.max(initial=-1)
+        if most_certain_node_connectedness == -1:
+            continue
+        r = np.flatnonzero((candidates == most_certain_node_connectedness).any(axis=1))[0]
+        ks = np.flatnonzero(candidates[r] == most_certain_node_connectedness)
+        most_certain_node = initial_separation_node_set[r]
+        most_certain_community = int(ks[np.argmin(last_neighbor[r, ks])])
+
+    return communities
+
+
+def simulated_annealing(G, warmstart, n_iterations, temp):
+    """
+    Simulated annealing approach using background knowledge.
+    
+    Parameters
+    ----------
+    G : networkx.classes.graph.Graph
+        The graph to be analysed.
+    warmstart :
+        Bitstring representing an initial solution
+    n_iterations : int
+        The amount of simulated annealing iterations.
+    temp : int
+        Starting temperature.
+    
+    Returns
+    -------
+    best found results throughout all runs.
+    """
+
+    n = G.number_of_nodes()
+
+    # only the diagonal and the inter-block edges are nonzero, so Q is stored sparse
+    blocks = nx.get_node_attributes(G, "block")
+    inter_block_edges = np.array([(i, j) for (i, j) in G.edges() if blocks[i] != blocks[j]], dtype=np.intp)
+    inter_block_edges = inter_block_edges.reshape(-1, 2)
+    rows = np.concatenate((np.arange(n), inter_block_edges[:, 0]))
+    cols = np.concatenate((np.arange(n), inter_block_edges[:, 1]))
+    values = np.concatenate((np.full(n, -1.0), np.full(len(inter_block_edges), 2.0)))
+    Q = sparse.csr_matrix((values, (rows, cols)), shape=(n, n))
+    Q_diagonal = Q.diagonal()
+
+    def f(solution): return solution @ (Q @ solution)
+    # generate an initial point
+    if warmstart is None:
+        x = np.zeros(n, dtype=np.bool8)
+    else:
+        x = warmstart
+    # init best solution found so far, curr is flipped in place and must not alias the warmstart
+    curr, curr_eval = np.copy(x), f(x)
+    # Q is not symmetric, flipping bit k by ds changes f by ds * ((Q + Q^T) @ x)[k] + ds^2 * Q[k][k]
+    Q_sym = (Q + Q.T).tocsc()
+    curr_gradient = Q_sym @ curr.astype(np.float64)
+    # the violations are updated from the connected components touched by the flipped bit only
+    violation_tracker = graphs.ConstraintViolationTracker(G, x)
+    curr_sep_set_viols, curr_inj_viols, curr_sur_viols = violation_tracker.violations
+
+    best, best_eval = x, curr_eval
+    best_sep_set_viols, best_inj_viols, best_sur_viols = curr_sep_set_viols, curr_inj_viols, curr_sur_viols
+
+    # drawn up front from the same generator, in the same order as drawing one per iteration
+    bit_flip_indices = [randrange(n) for _ in range(n_iterations)]
+
+    for i, bit_flip_index in enumerate(bit_flip_indices):
+        progress = i % _PROGRESS_INTERVAL == 0
+        if progress:
+            print('curr_eval: ' + str(curr_eval) + '\t curr_sep_set_viols: ' + str(curr_sep_set_viols) +
+                  '\t curr_sur_viols: ' + str(curr_sur_viols) + '\t curr_inj_viols: ' + str(curr_inj_viols), end='\r')
+        # the candidate is curr with the bit flipped in place, the flip is undone if the candidate is rejected
+        candidate = curr
+        candidate[bit_flip_index] = not curr[bit_flip_index]
+        # check if constraints are satisfied
+        cand_sep_set_viols, cand_inj_viols, cand_sur_viols = violation_tracker.flip(bit_flip_index)
+        # evaluate candidate point in O(n) from the single flipped bit
+        ds = 1 if candidate[bit_flip_index] else -1
+        candidate_eval = curr_eval + ds * curr_gradient[bit_flip_index] + Q_diagonal[bit_flip_index]
+        if candidate_eval <= best_eval and cand_sep_set_viols <= best_sep_set_viols and \
+           cand_sur_viols <= best_sur_viols and cand_inj_viols <= best_inj_viols:
+            best, best_eval, best_sep_set_viols, best_sur_viols, best_inj_viols = np.copy(candidate), candidate_eval, \
+                                                                                  cand_sep_set_viols, cand_sur_viols, \
+                                                                                  cand_inj_viols
+            # print('>%d f(x) = %.5f' % (i, best_eval))
+            if progress:
+                print('best_eval: ' + str(best_eval) + '\t best_sep_set_viols: ' + str(best_sep_set_viols) +
+                      '\t best_sur_viols: ' + str(best_sur_viols) + '\t best_inj_viols: ' + str(best_inj_viols),
+                      end='\r')
+        diff = candidate_eval - curr_eval
+        # calculate temperature for current epoch
+        t = temp / float(i + 1)
+        constraints_diff = (cand_sep_set_viols + cand_sur_viols + cand_inj_viols) - (curr_sep_set_viols + curr_inj_viols
+                                                                                     + curr_sur_viols)
+
+        # check if we should keep the new point, the metropolis acceptance criterion is only needed for worse points
+        if constraints_diff <= 0 and (diff <= 0 or rand() < math.exp(-diff / t)):
+            curr, curr_eval, curr_sep_set_viols, curr_inj_viols, curr_sur_viols = candidate, candidate_eval, \
+                                                                                  cand_sep_set_viols, \
+                                                                                  cand_inj_viols, cand_sur_viols
+            # only the rows of the nonzero entries in column bit_flip_index change
+            column = slice(Q_sym.indptr[bit_flip_index], Q_sym.indptr[bit_flip_index + 1])
+            curr_gradient[Q_sym.indices[column]] += ds * Q_sym.data[column]
+            violation_tracker.accept()
+        else:
+            curr[bit_flip_index] = not curr[bit_flip_index]
+        """
+        # metropolis_constraints = math.exp(-constraints_diff / t)
+        else:
+            if rand() < metropolis_constraints and cand_sep_set_viols <= curr_sep_set_viols:  # dice roll is required 
+            to not care about bijectivity
+                if diff <= 0 or rand() < metropolis_eval:
+                    curr, curr_eval, curr_sep_set_viols, curr_inj_viols, curr_sur_viols = candidate, candidate_eval, 
+                    cand_sep_set_viols, cand_inj_viols, cand_sur_viols"""
+    return best, best_eval, best_sep_set_viols, best_sur_viols, best_inj_viols